@@ -0,0 +1,169 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from lazy_import import HEAVY_MODULES
+
+# The Data Library scripts and the attribute of their first Data Library call
+SCRIPTS = {
+    'ld_session': 'ld.open_session',
+    'ld_access_historical': 'ld.get_history',
+    'ld_access_news': 'ld.news.get_headlines',
+    'ld_content_esg': 'esg.standard_scores.Definition',
+    'ld_content_historical': 'historical_pricing.summaries.Definition',
+    'ld_delivery_example': 'ld.delivery.endpoint_request.Definition'
+}
+
+RUNS = 5
+# The tracked results, compared with --check
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_imports.json')
+# --check fails when an import time is above baseline * TOLERANCE + SLACK_MS
+TOLERANCE = 1.5
+SLACK_MS = 20
+
+_IMPORT_TIME = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+def parse_importtime(text):
+    """
+    This method reads the -X importtime output.
+
+    Args:
+        text (str): The standard error of a python -X importtime process
+
+    Returns:
+        imports (dict): The cumulative import time in microseconds of the top-level imports, keyed by module name
+        modules (set of str): The names of all imported modules
+    """
+    imports = {}
+    modules = set()
+    for line in text.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match:
+            modules.add(match.group(4))
+            # One space before the top-level module names, two more per nesting level
+            if len(match.group(3)) == 1:
+                imports[match.group(4)] = int(match.group(2))
+    return imports, modules
+
+def run_importtime(statement):
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+    if process.returncode != 0:
+        raise RuntimeError((process.stderr.strip().splitlines() or ['no output'])[-1])
+    return parse_importtime(process.stderr)
+
+def measure(statement, startup, runs=RUNS):
+    """
+    This method measures the import time of a statement in new Python processes.
+
+    Args:
+        statement (str): The Python statement, e.g. 'import ld_session'
+        startup (set of str): The modules imported by the interpreter start up, not counted
+        runs (int): Number of processes, the median is kept
+
+    Returns:
+        import time (float): The median import time in milliseconds
+        modules (set of str): The modules imported by the statement
+    """
+    totals = []
+    for _ in range(runs):
+        imports, modules = run_importtime(statement)
+        totals.append(sum(cumulative for name, cumulative in imports.items() if name not in startup) / 1000)
+    return statistics.median(totals), modules - startup
+
+def run_benchmark(scripts, runs=RUNS):
+    """
+    This method measures the import time of each Data Library script, and the import time until its first
+    Data Library call.
+
+    Args:
+        scripts (list of str): The script module names, see SCRIPTS
+        runs (int): Number of processes per measure
+
+    Returns:
+        results (dict): The measured values keyed by script
+    """
+    _, startup = run_importtime('pass')
+    results = {}
+    for script in scripts:
+        import_ms, modules = measure(f'import {script}', startup, runs)
+        first_use_ms, first_use_modules = measure(f'import {script}; {script}.{SCRIPTS[script]}', startup, runs)
+        results[script] = {
+            'import_ms': round(import_ms, 1),
+            'modules': len(modules),
+            'heavy': [name for name in HEAVY_MODULES if name in modules],
+            'first_use_ms': round(first_use_ms, 1),
+            'first_use_heavy': [name for name in HEAVY_MODULES if name in first_use_modules]
+        }
+    return results
+
+def check(results, baseline):
+    """
+    This method compares the results with the tracked baseline.
+
+    Args:
+        results (dict): The run_benchmark() results
+        baseline (dict): The baseline results
+
+    Returns:
+        regressions (list of str): The scripts whose import time is above the tolerance
+    """
+    regressions = []
+    for script, result in results.items():
+        expected = baseline.get(script)
+        if expected is None:
+            continue
+        for key in ('import_ms', 'first_use_ms'):
+            if result[key] > expected[key] * TOLERANCE + SLACK_MS:
+                regressions.append(f'{script} {key}: {result[key]:.1f}ms, baseline {expected[key]:.1f}ms')
+        for name in result['heavy']:
+            if name not in expected['heavy']:
+                regressions.append(f'{script} imports {name} at start up')
+    return regressions
+
+def print_results(results, baseline=None):
+    print(f'{"script":<24}{"import":>10}{"modules":>9}{"first use":>12}  heavy modules at import')
+    for script, result in results.items():
+        line = f'{script:<24}{result["import_ms"]:>8.1f}ms{result["modules"]:>9}{result["first_use_ms"]:>10.1f}ms  {", ".join(result["heavy"]) or "-"}'
+        if baseline and script in baseline:
+            line += f'  (baseline {baseline[script]["import_ms"]:.1f}ms / {baseline[script]["first_use_ms"]:.1f}ms)'
+        print(line)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the start up import time of the Data Library scripts with python -X importtime')
+    parser.add_argument('--scripts', nargs='+', choices=list(SCRIPTS), default=list(SCRIPTS))
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='The tracked results file')
+    parser.add_argument('--save', action='store_true', help='Write the results to the baseline file')
+    parser.add_argument('--check', action='store_true', help='Exit with an error when an import time regressed from the baseline')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.scripts, args.runs)
+    baseline = None
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results, baseline)
+    if args.save:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+            baseline_file.write('\n')
+    if args.check and baseline:
+        regressions = check(results, baseline)
+        for regression in regressions:
+            print(f'Regression: {regression}')
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,290 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import time
+
+# Taken before any heavy import, the cold start covers imports, login and the first response
+PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+LAYERS = ['requests', 'access', 'content', 'delivery']
+ENDPOINTS = ['historical', 'news', 'esg', 'analytics']
+
+ITERATIONS = 100
+CONCURRENCY = 8
+THROUGHPUT_REQUESTS = 400
+
+UNIVERSE = 'IBM.N'
+FIELDS = ['BID', 'ASK', 'OPEN_PRC', 'HIGH_1', 'LOW_1', 'TRDPRC_1', 'NUM_MOVES', 'TRNOVR_UNS']
+START_DAY = '2025-01-01'
+END_DAY = '2025-02-10'
+NEWS_QUERY = f'R:{UNIVERSE} AND Language:LEN AND Source:RTRS'
+WORKING_DAY_PAYLOAD = {'universe': [{'calendarCodes': ['THA'], 'calculationDate': '2025-02-12'}]}
+
+def requests_calls(base_url):
+    """
+    This method logs in with Python/requests and returns the request function of each endpoint.
+
+    Args:
+        base_url (str): The RDP host URL
+
+    Returns:
+        calls (dict): The request function keyed by endpoint name
+    """
+    import rate_limiter
+    import rdp_client
+    import requests_historical
+    import single_flight
+
+    # Every call reaches the server, as with the Data Library layers
+    rate_limiter.configure(enabled=False)
+    single_flight.configure(enabled=False)
+    requests_historical.RDP_HOST = base_url
+    access_token, refresh_token, expires_in = requests_historical.login_v1('benchmark', 'benchmark', 'benchmark')
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    def get(path, params):
+        response = rdp_client.send_request('GET', f'{base_url}{path}', headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def post(path, body):
+        response = rdp_client.send_request('POST', f'{base_url}{path}', headers=headers, json=body, idempotent=True)
+        response.raise_for_status()
+        return response.json()
+
+    return {
+        'historical': lambda: get(f'/data/historical-pricing/v1/views/interday-summaries/{UNIVERSE}',
+                                  {'interval': 'P1W', 'count': 15, 'fields': ','.join(FIELDS), 'start': START_DAY, 'end': END_DAY}),
+        'news': lambda: get('/data/news/v1/headlines', {'query': NEWS_QUERY, 'limit': 5}),
+        'esg': lambda: get('/data/environmental-social-governance/v2/views/scores-standard', {'universe': UNIVERSE}),
+        'analytics': lambda: post('/analytics/functions/v1/common/is-working-day', WORKING_DAY_PAYLOAD)
+    }
+
+def open_ld_session(base_url):
+    """
+    This method opens a Data Library platform session against the RDP host URL.
+
+    Args:
+        base_url (str): The RDP host URL
+
+    Returns:
+        ld (module): The lseg.data module
+    """
+    import lseg.data as ld
+
+    config = {
+        'logs': {'level': 'error', 'transports': {'console': {'enabled': False}, 'file': {'enabled': False}}},
+        'sessions': {
+            'default': 'platform.benchmark',
+            'platform': {
+                'benchmark': {
+                    'app-key': 'benchmark',
+                    'username': 'benchmark',
+                    'password': 'benchmark',
+                    'signon_control': True,
+                    'base-url': base_url
+                }
+            }
+        }
+    }
+    config_path = os.path.join(tempfile.mkdtemp(), 'lseg-data.benchmark.config.json')
+    with open(config_path, 'w') as config_file:
+        json.dump(config, config_file)
+    ld.open_session(config_name=config_path)
+    return ld
+
+def access_calls(base_url):
+    ld = open_ld_session(base_url)
+    return {
+        'historical': lambda: ld.get_history(universe=UNIVERSE, interval='weekly', fields=FIELDS, count=15, start=START_DAY, end=END_DAY),
+        'news': lambda: ld.news.get_headlines(NEWS_QUERY, start=START_DAY, end=END_DAY, count=5)
+    }
+
+def content_calls(base_url):
+    ld = open_ld_session(base_url)
+    from lseg.data.content import esg, historical_pricing, news
+    from lseg.data.content.historical_pricing import Intervals
+
+    return {
+        'historical': lambda: historical_pricing.summaries.Definition(universe=UNIVERSE, interval=Intervals.WEEKLY, count=15, fields=FIELDS).get_data().data.df,
+        'news': lambda: news.headlines.Definition(NEWS_QUERY, count=5).get_data().data.df,
+        'esg': lambda: esg.standard_scores.Definition(UNIVERSE).get_data().data.df
+    }
+
+def delivery_calls(base_url):
+    ld = open_ld_session(base_url)
+    endpoint_request = ld.delivery.endpoint_request
+
+    def get(path, params):
+        return endpoint_request.Definition(url=f'{base_url}{path}',
+                                           method=endpoint_request.RequestMethod.GET,
+                                           query_parameters=params).get_data().data.raw
+
+    def post(path, body):
+        return endpoint_request.Definition(url=f'{base_url}{path}',
+                                           method=endpoint_request.RequestMethod.POST,
+                                           body_parameters=body).get_data().data.raw
+
+    return {
+        'historical': lambda: get(f'/data/historical-pricing/v1/views/interday-summaries/{UNIVERSE}',
+                                  {'interval': 'P1W', 'count': 15, 'fields': ','.join(FIELDS), 'start': START_DAY, 'end': END_DAY}),
+        'news': lambda: get('/data/news/v1/headlines', {'query': NEWS_QUERY, 'limit': 5}),
+        'esg': lambda: get('/data/environmental-social-governance/v2/views/scores-standard', {'universe': UNIVERSE}),
+        'analytics': lambda: post('/analytics/functions/v1/common/is-working-day', WORKING_DAY_PAYLOAD)
+    }
+
+LAYER_CALLS = {
+    'requests': requests_calls,
+    'access': access_calls,
+    'content': content_calls,
+    'delivery': delivery_calls
+}
+
+def peak_memory_mb():
+    """
+    This method returns the peak resident memory of the current process in MB.
+
+    Args:
+        None
+
+    Returns:
+        memory (float): The peak memory in MB, None if it is not available on this platform
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_worker(layer, endpoint, base_url, iterations, concurrency, throughput_requests):
+    """
+    This method measures one layer and endpoint in the current process.
+
+    Args:
+        layer (str): The layer name
+        endpoint (str): The endpoint name
+        base_url (str): The RDP host URL
+        iterations (int): Number of sequential requests for the latency percentiles
+        concurrency (int): Number of concurrent threads for the throughput test
+        throughput_requests (int): Number of requests for the throughput test
+
+    Returns:
+        result (dict): The measured values
+    """
+    call = LAYER_CALLS[layer](base_url).get(endpoint)
+    if call is None:
+        return {'layer': layer, 'endpoint': endpoint, 'supported': False}
+
+    call()
+    cold_start = time.perf_counter() - PROCESS_START
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(call) for _ in range(throughput_requests)]:
+            future.result()
+    throughput = throughput_requests / (time.perf_counter() - start)
+
+    return {
+        'layer': layer,
+        'endpoint': endpoint,
+        'supported': True,
+        'cold_start_s': cold_start,
+        'p50_ms': statistics.median(samples),
+        'p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        'throughput_rps': throughput,
+        'peak_memory_mb': peak_memory_mb()
+    }
+
+def run_benchmark(layers, endpoints, iterations, concurrency, throughput_requests, base_url=None):
+    """
+    This method runs every layer and endpoint in its own Python process against the local RDP stand-in server.
+
+    Args:
+        layers (list of str): The layer names
+        endpoints (list of str): The endpoint names
+        iterations (int): Number of sequential requests for the latency percentiles
+        concurrency (int): Number of concurrent threads for the throughput test
+        throughput_requests (int): Number of requests for the throughput test
+        base_url (str): An already running RDP stand-in server URL (optional)
+
+    Returns:
+        results (list of dict): The measured values of each layer and endpoint
+    """
+    import mock_rdp_server
+
+    server = None
+    if base_url is None:
+        server, base_url = mock_rdp_server.start_server()
+
+    results = []
+    for layer in layers:
+        for endpoint in endpoints:
+            command = [sys.executable, os.path.abspath(__file__), '--worker', layer, endpoint, '--base-url', base_url,
+                       '--iterations', str(iterations), '--concurrency', str(concurrency), '--requests', str(throughput_requests)]
+            process = subprocess.run(command, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            lines = process.stdout.strip().splitlines()
+            if process.returncode == 0 and lines:
+                results.append(json.loads(lines[-1]))
+            else:
+                error = (process.stderr.strip().splitlines() or ['no output'])[-1]
+                results.append({'layer': layer, 'endpoint': endpoint, 'supported': True, 'error': error})
+
+    if server is not None:
+        server.shutdown()
+    return results
+
+def print_results(results):
+    print(f'{"layer":<10}{"endpoint":<12}{"cold start":>12}{"p50":>10}{"p99":>10}{"req/s":>10}{"peak mem":>11}')
+    for result in results:
+        prefix = f'{result["layer"]:<10}{result["endpoint"]:<12}'
+        if not result['supported']:
+            print(f'{prefix}{"n/a (not offered by this layer)":>63}')
+        elif 'error' in result:
+            print(f'{prefix}  error: {result["error"]}')
+        else:
+            memory = f'{result["peak_memory_mb"]:>8.1f}MB' if result['peak_memory_mb'] is not None else f'{"n/a":>10}'
+            print(f'{prefix}{result["cold_start_s"]:>11.3f}s{result["p50_ms"]:>8.2f}ms{result["p99_ms"]:>8.2f}ms'
+                  f'{result["throughput_rps"]:>10.1f} {memory}')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark Python/requests against the Data Library Access, Content and Delivery layers')
+    parser.add_argument('--layers', nargs='+', choices=LAYERS, default=LAYERS)
+    parser.add_argument('--endpoints', nargs='+', choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY)
+    parser.add_argument('--requests', type=int, default=THROUGHPUT_REQUESTS)
+    parser.add_argument('--base-url', help='Use an already running RDP stand-in server')
+    parser.add_argument('--worker', nargs=2, metavar=('LAYER', 'ENDPOINT'), help=argparse.SUPPRESS)
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(*args.worker, args.base_url, args.iterations, args.concurrency, args.requests)))
+    else:
+        results = run_benchmark(args.layers, args.endpoints, args.iterations, args.concurrency, args.requests, args.base_url)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_results(results)
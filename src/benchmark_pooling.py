@@ -0,0 +1,99 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import contextlib
+import os
+import statistics
+import time
+import rate_limiter
+import rdp_client
+import single_flight
+import mock_rdp_server
+import requests_esg
+import requests_historical
+import requests_news
+import requests_session_v1
+
+ITERATIONS = 200
+
+def percentile(samples, pct):
+    """
+    This method returns the nearest-rank percentile of the samples.
+
+    Args:
+        samples (list of float): The measured samples
+        pct (float): The percentile (0-100)
+
+    Returns:
+        value (float): The percentile value
+    """
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def measure(func, *args):
+    """
+    This method calls the function ITERATIONS times and returns the per-call latency in milliseconds.
+
+    Args:
+        func (function): The request function
+        *args: The request function parameters
+
+    Returns:
+        samples (list of float): The per-call latency in milliseconds
+    """
+    samples = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(ITERATIONS):
+            start = time.perf_counter()
+            func(*args)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def run_benchmark(keep_alive):
+    """
+    This method measures all request functions with (or without) connection pooling.
+
+    Args:
+        keep_alive (bool): Reuse the pooled connections between calls
+
+    Returns:
+        results (dict): The latency samples keyed by function name
+    """
+    rdp_client.configure(keep_alive=keep_alive)
+    token = 'benchmark-token'
+    calls = {
+        'login_v1': (requests_session_v1.login_v1, 'user', 'password', 'app_key'),
+        'get_historical_interday_data': (requests_historical.get_historical_interday_data, 'IBM.N', token),
+        'get_news_headlines': (requests_news.get_news_headlines, 'IBM.N', token),
+        'get_news_story': (requests_news.get_news_story, 'urn:newsml:reuters.com:20250210:nL1N3OX0001:1', token),
+        'get_esg_standard': (requests_esg.get_esg_standard, 'IBM.N', token)
+    }
+    results = {}
+    for name, (func, *args) in calls.items():
+        results[name] = measure(func, *args)
+    rdp_client.close_session()
+    return results
+
+if __name__ == '__main__':
+    # Measure the transport only, not the client-side throttling and request coalescing
+    rate_limiter.configure(enabled=False)
+    single_flight.configure(enabled=False)
+    server, base_url = mock_rdp_server.start_server()
+    for module in (requests_session_v1, requests_historical, requests_news, requests_esg):
+        module.RDP_HOST = base_url
+    print(f'Mock RDP server: {base_url}, {ITERATIONS} calls per function')
+
+    pooled = run_benchmark(keep_alive=True)
+    unpooled = run_benchmark(keep_alive=False)
+
+    print(f'{"function":<30}{"pooled p50":>12}{"pooled p99":>12}{"no-pool p50":>13}{"no-pool p99":>13}')
+    for name in pooled:
+        print(f'{name:<30}'
+              f'{statistics.median(pooled[name]):>10.3f}ms{percentile(pooled[name], 99):>10.3f}ms'
+              f'{statistics.median(unpooled[name]):>11.3f}ms{percentile(unpooled[name], 99):>11.3f}ms')
+    server.shutdown()
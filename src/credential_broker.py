@@ -0,0 +1,373 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import hashlib
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+try:
+    import fcntl
+except ImportError:  # Windows, the named pipes do not leave stale files
+    fcntl = None
+import rdp_config
+from token_manager import TokenManagerV1, TokenManagerV2
+
+# The clients ask the broker again after this time (seconds), even if their token is still valid
+CLIENT_TTL = 30
+# The clients never use a token that expires within this time (seconds)
+EXPIRY_MARGIN = 10
+# The clients reconnect, or elect a new broker, until this time (seconds) when the broker is gone
+BROKER_TIMEOUT = 10
+# Time between two reconnection attempts (seconds)
+RETRY_DELAY = 0.1
+
+def default_address():
+    """
+    This method returns the default broker address, a Unix socket in the temporary directory (a named pipe on Windows).
+
+    Args:
+        None
+
+    Returns:
+        address (str): The broker address
+    """
+    if sys.platform == 'win32':
+        return r'\\.\pipe\rdp-credential-broker'
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(tempfile.gettempdir(), f'rdp-credential-broker-{user}.sock')
+
+def authkey_for(*credentials):
+    """
+    This method derives the broker authentication key from the RDP credentials, only the processes that
+    know the credentials can get a token from the broker.
+
+    Args:
+        *credentials (str): The RDP credentials, e.g. username, password and app_key, or client_id and client_secret
+
+    Returns:
+        authkey (bytes): The authentication key
+    """
+    return hashlib.sha256('\0'.join(credentials).encode('utf-8')).digest()
+
+class CredentialBroker:
+    """
+    This class owns the single RDP session of a TokenManager and serves its current access token to the local processes.
+
+    Args:
+        token_manager (TokenManager): The token_manager.TokenManagerV1 or TokenManagerV2 object
+        authkey (bytes): The authentication key shared with the clients
+        address (str): The Unix socket path or Windows named pipe (optional)
+        revoke (bool): Revoke the access token when the broker stops, False if the clients may still use it
+    """
+
+    def __init__(self, token_manager, authkey, address=None, revoke=True):
+        self.token_manager = token_manager
+        self.authkey = authkey
+        self.address = address or default_address()
+        self.revoke = revoke
+        self._listener = None
+        self._thread = None
+        self._connections = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """
+        This method binds the broker address, logs in and starts serving the token.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._listener = Listener(self.address, authkey=self.authkey)
+        try:
+            self.token_manager.start()
+        except Exception:
+            self._listener.close()
+            raise
+        self._thread = threading.Thread(target=self._serve, name='rdp-credential-broker', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        This method stops serving the token, closes the client connections and stops the RDP session
+        (the access token is revoked only if revoke is set).
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            listener, self._listener = self._listener, None
+            connections = list(self._connections)
+        if listener is not None:
+            listener.close()
+        for connection in connections:
+            _shutdown(connection)
+        self.token_manager.stop(revoke=self.revoke)
+
+    close = stop
+
+    def serve_forever(self):
+        self._thread.join()
+
+    def get_token(self):
+        return self.token_manager.get_token()
+
+    def invalidate(self, access_token=None, wait=False):
+        self.token_manager.invalidate(access_token, wait)
+
+    @property
+    def expires_in(self):
+        return self.token_manager.expires_in
+
+    def _serve(self):
+        while self._listener is not None:
+            try:
+                connection = self._listener.accept()
+            except Exception:
+                # Closed by stop(), or a client failed the authentication
+                if self._listener is None:
+                    break
+                continue
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection):
+        with self._lock:
+            if self._listener is None:
+                connection.close()
+                return
+            self._connections.add(connection)
+        with connection:
+            while True:
+                try:
+                    command, argument = connection.recv()
+                except (EOFError, OSError):
+                    break
+                if self._listener is None:
+                    # Stopped, the client connects to the next broker
+                    break
+                try:
+                    if command == 'invalidate':
+                        # Only this client waits for the new token
+                        self.token_manager.invalidate(argument, wait=True)
+                    connection.send(('ok', self.token_manager.get_token(), self.token_manager.expires_in))
+                except Exception as exp:
+                    connection.send(('error', str(exp), 0))
+        with self._lock:
+            self._connections.discard(connection)
+
+def _shutdown(connection):
+    # Wake up the thread blocked in recv(), it closes the connection
+    try:
+        with socket.socket(fileno=os.dup(connection.fileno())) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except (OSError, ValueError):
+        # Windows named pipe, or already closed
+        connection.close()
+
+def _open_lock_file(path):
+    # Only the current user can open the lock file, the temporary directory is shared with the other users
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+    if os.fstat(fd).st_uid != os.getuid():
+        os.close(fd)
+        raise PermissionError(f'The broker lock file {path} belongs to another user')
+    return fd
+
+class BrokerClient:
+    """
+    This class gets the access token from a CredentialBroker. It has the TokenManager get_token() and invalidate()
+    methods, so it can be passed to rdp_async_client.AsyncRDPClient. With a token manager, the client starts a broker
+    in its own process when the broker is gone and no other process has started one yet.
+
+    Args:
+        authkey (bytes): The authentication key shared with the broker
+        address (str): The Unix socket path or Windows named pipe (optional)
+        token_manager (TokenManager): The token manager of the broker started by this client (optional)
+    """
+
+    def __init__(self, authkey, address=None, token_manager=None):
+        self.authkey = authkey
+        self.address = address or default_address()
+        self.token_manager = token_manager
+        self._broker = None
+        self._connection = None
+        self._access_token = None
+        self._expires_at = 0
+        self._fetched_at = 0
+        self._rejected = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        with self._lock:
+            if self._connection is None:
+                self._connection = Client(self.address, authkey=self.authkey)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            broker, self._broker = self._broker, None
+        if broker is not None:
+            broker.stop()
+
+    def take_over(self):
+        """
+        This method starts a broker in the current process, unless another process serves the address.
+        One process at a time checks and starts it, under a file lock.
+
+        Args:
+            None
+
+        Returns:
+            result (bool): True if the broker is started in this process
+        """
+        lock_file = _open_lock_file(f'{self.address}.lock') if fcntl else None
+        try:
+            if lock_file is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                Client(self.address, authkey=self.authkey).close()
+                return False
+            except (FileNotFoundError, ConnectionRefusedError):
+                pass
+            # Remove the socket file a stopped or crashed broker may have left
+            if fcntl and os.path.exists(self.address):
+                os.remove(self.address)
+            # The other processes may still use the token of this session after this process exits
+            broker = CredentialBroker(self.token_manager, self.authkey, self.address, revoke=False)
+            broker.start()
+            self._broker = broker
+            return True
+        finally:
+            if lock_file is not None:
+                os.close(lock_file)
+
+    def get_token(self):
+        """
+        This method returns the current access token, it asks the broker only when the local copy is old.
+
+        Args:
+            None
+
+        Returns:
+            access token (str): The Access Token
+        """
+        now = time.monotonic()
+        if self._access_token and self._access_token != self._rejected and now - self._fetched_at < CLIENT_TTL and now < self._expires_at - EXPIRY_MARGIN:
+            return self._access_token
+        return self._request('get_token')
+
+    def invalidate(self, access_token=None, wait=False):
+        """
+        This method asks the broker to refresh the session, for example after a HTTP 401 response.
+        The broker answers with the new token, so the client always waits for it.
+
+        Args:
+            access_token (str): The rejected access token (optional)
+            wait (bool): Wait until the rejected token is replaced (always done)
+
+        Returns:
+            None
+        """
+        self._rejected = access_token or self._access_token
+        self._request('invalidate', self._rejected)
+
+    @property
+    def expires_in(self):
+        return max(0, self._expires_at - time.monotonic())
+
+    def _request(self, command, argument=None):
+        with self._lock:
+            # Reconnect if the broker was restarted, or elect a new one if it is gone, until the deadline
+            deadline = time.monotonic() + BROKER_TIMEOUT
+            while True:
+                try:
+                    if self._connection is None:
+                        self._connection = Client(self.address, authkey=self.authkey)
+                    self._connection.send((command, argument))
+                    status, value, expires_in = self._connection.recv()
+                    break
+                except (EOFError, OSError):
+                    if self._connection is not None:
+                        self._connection.close()
+                        self._connection = None
+                    if time.monotonic() >= deadline:
+                        raise
+                if self.token_manager is not None and self._broker is None:
+                    try:
+                        # Under the file lock, starts a broker only if no other process serves the address
+                        self.take_over()
+                        continue
+                    except (EOFError, OSError):
+                        # The broker that was serving exits too, try again
+                        pass
+                time.sleep(RETRY_DELAY)
+            if status != 'ok':
+                raise RuntimeError(f'RDP credential broker error: {value}')
+            self._access_token = value
+            self._fetched_at = time.monotonic()
+            self._expires_at = self._fetched_at + expires_in
+            return value
+
+def get_token_source(token_manager, authkey, address=None):
+    """
+    This method connects to the broker of this address, or starts one in the current process if none is running.
+    The first process owns the RDP session, the others reuse its token without logging in. When the broker process
+    exits, the next client that needs a token starts a new broker.
+
+    Args:
+        token_manager (TokenManager): The token manager the broker uses if it is started here (it is not logged in otherwise)
+        authkey (bytes): The authentication key
+        address (str): The Unix socket path or Windows named pipe (optional)
+
+    Returns:
+        token source (BrokerClient): An object with get_token() and invalidate() methods, close() it when done
+    """
+    client = BrokerClient(authkey, address, token_manager)
+    try:
+        client.connect()
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.take_over()
+        client.connect()
+    return client
+
+if __name__ == '__main__':
+    try:
+        if rdp_config.get('credentials.client-id'):
+            print('Start Credential Broker (Authentication Version 2)')
+            client_id = rdp_config.get('credentials.client-id')
+            client_secret = rdp_config.get('credentials.client-secret')
+            broker = CredentialBroker(TokenManagerV2(client_id, client_secret), authkey_for(client_id, client_secret))
+        else:
+            print('Start Credential Broker (Authentication Version 1)')
+            username = rdp_config.get('credentials.username')
+            app_key = rdp_config.get('credentials.app-key')
+            password = rdp_config.get('credentials.password')
+            broker = CredentialBroker(TokenManagerV1(username, password, app_key), authkey_for(username, password, app_key))
+        with broker:
+            print(f'Serving the RDP access token on {broker.address}')
+            broker.serve_forever()
+    except KeyboardInterrupt:
+        print('Stop Credential Broker')
+    except Exception as exp:
+        print(f'Exception {exp}')
@@ -0,0 +1,180 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import rdp_config
+import requests_esg
+
+STORE_PATH = rdp_config.get('cache.esg-store')
+
+def group_by_instrument(content):
+    """
+    This method groups the rows of a ESG scores-standard response by instrument.
+
+    Args:
+        content (dict): The ESG scores-standard response message
+
+    Returns:
+        names (list of str): The field names
+        records (dict): The rows keyed by RIC, each list keyed by period end date
+    """
+    names = [header['name'] for header in content.get('headers', [])]
+    lower_names = [name.lower() for name in names]
+    instrument_index = lower_names.index('instrument') if 'instrument' in lower_names else 0
+    period_index = lower_names.index('periodenddate') if 'periodenddate' in lower_names else 1
+    records = {}
+    for row in content.get('data') or []:
+        records.setdefault(row[instrument_index], {})[str(row[period_index])] = row
+    return names, records
+
+def record_hash(names, periods):
+    """
+    This method returns the hash of one instrument ESG record, it does not depend on the row order.
+
+    Args:
+        names (list of str): The field names
+        periods (dict): The rows keyed by period end date
+
+    Returns:
+        hash (str): The SHA-256 hex digest of the record
+    """
+    record = json.dumps([names, sorted(periods.items())], separators=(',', ':'))
+    return hashlib.sha256(record.encode('utf-8')).hexdigest()
+
+class EsgStore:
+    """
+    This class is a local versioned SQLite store of ESG scores-standard records. Every update is a new snapshot version,
+    only the instruments whose record hash changed are stored again and reported as changes.
+
+    Args:
+        path (str): The SQLite database file path
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS snapshots (version INTEGER PRIMARY KEY AUTOINCREMENT, taken_at REAL)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS records ('
+                         'ric TEXT, version INTEGER, hash TEXT, names TEXT, periods TEXT, PRIMARY KEY (ric, version))')
+        self._db.execute('CREATE TABLE IF NOT EXISTS latest (ric TEXT PRIMARY KEY, version INTEGER, hash TEXT)')
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get(self, ric, version=None):
+        """
+        This method returns the stored ESG record of an instrument.
+
+        Args:
+            ric (str): RIC Code
+            version (int): The snapshot version, defaults to the latest one
+
+        Returns:
+            names (list of str): The field names, or None
+            periods (dict): The rows keyed by period end date, or None
+        """
+        with self._lock:
+            if version is None:
+                row = self._db.execute('SELECT r.names, r.periods FROM latest l JOIN records r ON r.ric = l.ric AND r.version = l.version '
+                                       'WHERE l.ric = ?', (ric,)).fetchone()
+            else:
+                row = self._db.execute('SELECT names, periods FROM records WHERE ric = ? AND version <= ? ORDER BY version DESC LIMIT 1',
+                                       (ric, version)).fetchone()
+        if row is None:
+            return None, None
+        return json.loads(row[0]), json.loads(row[1])
+
+    def update(self, content):
+        """
+        This method stores a ESG scores-standard response as a new snapshot and returns the rows that changed since
+        the previous one. The instruments not in the response are left as they are.
+
+        Args:
+            content (dict): The ESG scores-standard response message
+
+        Returns:
+            version (int): The snapshot version
+            changes (list of tuple): The (RIC, period end date, row, previous row or None) of each new or changed row
+        """
+        names, records = group_by_instrument(content)
+        hashes = {ric: record_hash(names, periods) for ric, periods in records.items()}
+        changes = []
+        with self._lock:
+            previous = {}
+            rics = list(records)
+            # Stay below the SQLite host parameter limit
+            for index in range(0, len(rics), 500):
+                batch = rics[index:index + 500]
+                previous.update(self._db.execute(f'SELECT ric, hash FROM latest WHERE ric IN ({",".join("?" * len(batch))})', batch))
+            changed = [ric for ric in rics if previous.get(ric) != hashes[ric]]
+
+            with self._db:
+                version = self._db.execute('INSERT INTO snapshots (taken_at) VALUES (?)', (time.time(),)).lastrowid
+                for ric in changed:
+                    old_periods = {}
+                    if ric in previous:
+                        row = self._db.execute('SELECT r.names, r.periods FROM latest l JOIN records r ON r.ric = l.ric AND r.version = l.version '
+                                               'WHERE l.ric = ?', (ric,)).fetchone()
+                        if json.loads(row[0]) == names:
+                            old_periods = json.loads(row[1])
+                    for period, row in records[ric].items():
+                        if old_periods.get(period) != row:
+                            changes.append((ric, period, row, old_periods.get(period)))
+                    self._db.execute('INSERT INTO records (ric, version, hash, names, periods) VALUES (?, ?, ?, ?, ?)',
+                                     (ric, version, hashes[ric], json.dumps(names), json.dumps(records[ric])))
+                    self._db.execute('INSERT OR REPLACE INTO latest (ric, version, hash) VALUES (?, ?, ?)', (ric, version, hashes[ric]))
+        return version, changes
+
+    def get_esg_standard_changes(self, universe, access_token, batch_size=requests_esg.ESG_BATCH_SIZE):
+        """
+        This method requests the ESG Standard data of a universe in batches and returns only the rows that changed
+        since the previous snapshot.
+
+        Args:
+            universe (list of str): RIC Codes
+            access_token (str): The access token
+            batch_size (int): Maximum number of RICs per request
+
+        Returns:
+            version (int): The snapshot version
+            changes (list of tuple): The (RIC, period end date, row, previous row or None) of each new or changed row
+            errors (dict): The exception keyed by RIC for the RICs of the failed batches
+        """
+        content, errors = requests_esg.get_esg_standard_batch(universe, access_token, batch_size)
+        version, changes = self.update(content)
+        return version, changes, errors
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    universe = ['IBM.N', 'MSFT.O', 'AAPL.O', 'AMZN.O', 'GOOGL.O']
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_esg.login_v1(username, password, app_key)
+
+        if access_token:
+            store = EsgStore()
+            version, changes, errors = store.get_esg_standard_changes(universe, access_token)
+            print(f'ESG snapshot {version}: {len(changes)} changed rows in {len({change[0] for change in changes})} instruments')
+            for ric, period, row, previous in changes:
+                print(f'{ric} {period}: {previous} -> {row}')
+            store.close()
+
+            print('Sending Logout request message to RDP')
+            requests_esg.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')
@@ -0,0 +1,185 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import datetime
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import rdp_config
+import requests_historical
+from requests_historical import HISTORICAL_FIELDS
+
+CACHE_PATH = rdp_config.get('cache.historical')
+
+# Ranges that end at least SETTLE_DAYS before today are closed and never re-fetched
+SETTLE_DAYS = 1
+# Time to live of an open range (seconds), its tail is re-fetched after that
+OPEN_TTL = 15 * 60
+
+def cache_key(universe, interval, start_day, end_day, fields, count):
+    """
+    This method returns the content-addressed key of a historical interday request.
+
+    Args:
+        universe (str): RIC Code
+        interval (str): The summaries interval
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        fields (str or list of str): The interested field names
+        count (int): Maximum number of rows
+
+    Returns:
+        key (str): The SHA-256 hex digest of the request parameters
+    """
+    if not isinstance(fields, str):
+        fields = ','.join(fields)
+    params = json.dumps([universe, interval, start_day, end_day, fields, count], separators=(',', ':'))
+    return hashlib.sha256(params.encode('utf-8')).hexdigest()
+
+def is_closed_range(end_day, today=None):
+    """
+    This method checks if the date range is fully in the past, so its data never changes.
+
+    Args:
+        end_day (str): The end date in YYYY-MM-DD format
+        today (datetime.date): The current date (defaults to today in UTC)
+
+    Returns:
+        result (bool): True if the range is closed
+    """
+    today = today or datetime.datetime.now(datetime.timezone.utc).date()
+    end = datetime.date.fromisoformat(end_day[:10])
+    return end <= today - datetime.timedelta(days=SETTLE_DAYS)
+
+def merge_tail(cached, tail, count):
+    """
+    This method replaces the rows of the cached response from the first tail date onward with the tail rows.
+
+    Args:
+        cached (list): The cached Interday summaries response message
+        tail (list): The Interday summaries response message of the open tail
+        count (int): Maximum number of rows
+
+    Returns:
+        merged (list): The merged Interday summaries response message
+    """
+    if not tail or not tail[0].get('data'):
+        return cached
+    if not cached or not cached[0].get('data'):
+        return tail
+    date_index = _date_index(cached[0])
+    tail_rows = tail[0]['data']
+    # Rows are sorted by date in descending order
+    oldest_tail_date = tail_rows[-1][date_index]
+    rows = tail_rows + [row for row in cached[0]['data'] if row[date_index] < oldest_tail_date]
+    merged = dict(cached[0])
+    merged['data'] = rows[:count]
+    return [merged] + cached[1:]
+
+def _date_index(content):
+    names = [header['name'] for header in content.get('headers', [])]
+    return names.index('DATE') if 'DATE' in names else 0
+
+class HistoricalCache:
+    """
+    This class is a persistent SQLite cache of RDP Historical Pricing Interday summaries responses.
+
+    Args:
+        path (str): The SQLite database file path
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS interday ('
+                         'key TEXT PRIMARY KEY, ric TEXT, interval TEXT, start TEXT, end TEXT, fields TEXT, '
+                         'fetched_at REAL, expires_at REAL, content TEXT)')
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get(self, key):
+        """
+        This method returns the cached content and its expiry time.
+
+        Args:
+            key (str): The cache key
+
+        Returns:
+            content (list): The cached response message, or None
+            expires_at (float): The expiry epoch time, None for immutable content
+        """
+        with self._lock:
+            row = self._db.execute('SELECT content, expires_at FROM interday WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None, None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key, universe, interval, start_day, end_day, fields, content, expires_at):
+        """
+        This method stores the response content.
+
+        Args:
+            key (str): The cache key
+            universe (str): RIC Code
+            interval (str): The summaries interval
+            start_day (str): The start date in YYYY-MM-DD format
+            end_day (str): The end date in YYYY-MM-DD format
+            fields (str): The interested field names
+            content (list): The response message
+            expires_at (float): The expiry epoch time, None for immutable content
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO interday VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             (key, universe, interval, start_day, end_day, fields, time.time(), expires_at,
+                              json.dumps(content, separators=(',', ':'))))
+            self._db.commit()
+
+    def get_historical_interday_data(self, universe, access_token, interval='P1W', start_day='2025-01-01', end_day='2025-02-10', fields=HISTORICAL_FIELDS, count=15):
+        """
+        This method returns the Interday data from the cache, it requests RDP only for a missing range
+        or for the open tail of an expired open range.
+
+        Args:
+            universe (str): RIC Code
+            access_token (str): The access token
+            interval (str): The summaries interval (ISO 8601 duration, 'P1W' is weekly)
+            start_day (str): The start date in YYYY-MM-DD format
+            end_day (str): The end date in YYYY-MM-DD format
+            fields (str or list of str): The interested field names
+            count (int): Maximum number of rows
+
+        Returns:
+            interday data (json): The Interday data content
+        """
+        if not isinstance(fields, str):
+            fields = ','.join(fields)
+        key = cache_key(universe, interval, start_day, end_day, fields, count)
+        cached, expires_at = self.get(key)
+        if cached is not None and (expires_at is None or expires_at > time.time()):
+            return cached
+
+        # Re-fetch only from the latest cached bar, which may still be incomplete
+        fetch_start = start_day
+        if cached and cached[0].get('data'):
+            fetch_start = max(start_day, cached[0]['data'][0][_date_index(cached[0])][:10])
+
+        response = requests_historical.send_historical_interday_request(universe, access_token, interval, fetch_start, end_day, fields, count)
+        response.raise_for_status()
+        content = merge_tail(cached, response.json(), count) if cached else response.json()
+
+        expires_at = None if is_closed_range(end_day) else time.time() + OPEN_TTL
+        self.put(key, universe, interval, start_day, end_day, fields, content, expires_at)
+        return content
@@ -0,0 +1,95 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import timeit
+import numpy as np
+
+# Numeric fields that hold counts, they are parsed as int64 (float64 if they contain null values)
+INTEGER_FIELDS = {'NUM_MOVES', 'ACVOL_UNS', 'BLKCOUNT', 'BLKVOLUM', 'NUM_BIDS', 'NUM_ASKS', 'TRD_VOLUME'}
+
+def parse_column(name, field_type, values):
+    """
+    This method converts the values of one column to a typed NumPy array.
+
+    Args:
+        name (str): The field name
+        field_type (str): The field type from the response headers ('string', 'number', 'integer')
+        values (tuple): The column values
+
+    Returns:
+        column (numpy.ndarray): The typed column
+    """
+    if name == 'DATE':
+        return np.array(values, dtype='datetime64[D]')
+    if name == 'DATE_TIME':
+        return np.array([value.rstrip('Z') if value else 'NaT' for value in values], dtype='datetime64[ns]')
+    if field_type == 'integer' or name in INTEGER_FIELDS:
+        try:
+            return np.array(values, dtype=np.int64)
+        except (TypeError, ValueError):
+            return np.array(values, dtype=np.float64)
+    if field_type == 'number':
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+def parse_historical_pricing(content):
+    """
+    This method converts a RDP Historical Pricing response (headers + data row arrays) to typed NumPy columns.
+    The rows are transposed once, no per-row dict is built.
+
+    Args:
+        content (list or dict): The Historical Pricing response message (or its first item)
+
+    Returns:
+        columns (dict): The NumPy array keyed by field name
+    """
+    if isinstance(content, list):
+        content = content[0] if content else {}
+    headers = content.get('headers', [])
+    rows = content.get('data') or []
+    if rows:
+        values = list(zip(*rows))
+    else:
+        values = [()] * len(headers)
+    return {header['name']: parse_column(header['name'], header.get('type'), column) for header, column in zip(headers, values)}
+
+def to_dataframe(columns, index='DATE'):
+    """
+    This method wraps the parsed NumPy columns into a pandas DataFrame without copying the row data again.
+
+    Args:
+        columns (dict): The parsed columns from parse_historical_pricing()
+        index (str): The column to use as index (optional)
+
+    Returns:
+        data (pandas.DataFrame): The columns in a DataFrame object
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(columns, copy=False)
+    if index in df.columns:
+        df = df.set_index(index)
+    return df
+
+if __name__ == '__main__':
+    import mock_rdp_server
+
+    content = mock_rdp_server.historical_interday_response('IBM.N', 10000)
+    names = [header['name'] for header in content[0]['headers']]
+
+    def per_row_dicts():
+        return [dict(zip(names, row)) for row in content[0]['data']]
+
+    number = 20
+    print(f'Parse {len(content[0]["data"])} rows, average of {number} runs')
+    print(f'per-row dicts:            {timeit.timeit(per_row_dicts, number=number) / number * 1000:.3f}ms')
+    print(f'parse_historical_pricing: {timeit.timeit(lambda: parse_historical_pricing(content), number=number) / number * 1000:.3f}ms')
+    try:
+        import pandas as pd
+        print(f'pandas.DataFrame(rows):   {timeit.timeit(lambda: pd.DataFrame(content[0]["data"], columns=names), number=number) / number * 1000:.3f}ms')
+    except ImportError:
+        pass
@@ -0,0 +1,149 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+import rdp_client
+import rdp_config
+import requests_historical
+from requests_historical import HISTORICAL_FIELDS
+from historical_cache import HistoricalCache
+
+# Maximum number of rows the Interday summaries endpoint returns per request
+MAX_ROWS = 10000
+
+# Calendar days covered by one row of each interval, a chunk never holds more than max_rows rows
+INTERVAL_DAYS = {
+    'P1D': 1,
+    'P7D': 7,
+    'P1W': 7,
+    'P1M': 31,
+    'P3M': 92,
+    'P12M': 366,
+    'P1Y': 366
+}
+
+# The chunks are whole cells of this fixed grid, whatever the requested dates, so the cache keys of the chunks
+# do not depend on the range and overlapping ranges of different runs share the same cached chunks
+GRID_ORIGIN = datetime.date(2000, 1, 3)
+# Maximum number of rows of a grid cell, smaller than MAX_ROWS so a short range does not download decades of rows
+CELL_ROWS = 1000
+
+def split_range(start_day, end_day, interval='P1D', max_rows=MAX_ROWS):
+    """
+    This method splits a date range into the whole grid cells that cover it, each cell fits in one Interday
+    summaries request. The first and last cells may extend beyond the requested dates, merge_chunks() trims the rows.
+
+    Args:
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        interval (str): The summaries interval (ISO 8601 duration)
+        max_rows (int): Maximum number of rows per request
+
+    Returns:
+        chunks (list of tuple): The (start, end) dates of each grid cell in YYYY-MM-DD format, oldest first
+    """
+    if interval not in INTERVAL_DAYS:
+        raise ValueError(f'Unsupported interval: {interval}')
+    chunk_days = INTERVAL_DAYS[interval] * min(max_rows, CELL_ROWS)
+    start = datetime.date.fromisoformat(start_day[:10])
+    end = datetime.date.fromisoformat(end_day[:10])
+    if end < start:
+        raise ValueError(f'End date {end_day} is before start date {start_day}')
+
+    chunks = []
+    first = (start - GRID_ORIGIN).days // chunk_days
+    last = (end - GRID_ORIGIN).days // chunk_days
+    for index in range(first, last + 1):
+        chunk_start = GRID_ORIGIN + datetime.timedelta(days=index * chunk_days)
+        chunk_end = chunk_start + datetime.timedelta(days=chunk_days - 1)
+        chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+    return chunks
+
+def merge_chunks(contents, start_day, end_day):
+    """
+    This method merges the chunk responses into one response, it removes the duplicated boundary rows
+    and the rows outside the requested range.
+
+    Args:
+        contents (list): The Interday summaries response messages of each chunk
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+
+    Returns:
+        merged (list): The merged Interday summaries response message, rows in descending date order
+    """
+    contents = [content for content in contents if content and content[0].get('data') is not None]
+    if not contents:
+        return []
+    names = [header['name'] for header in contents[0][0].get('headers', [])]
+    date_index = names.index('DATE') if 'DATE' in names else 0
+
+    rows = {}
+    for content in contents:
+        for row in content[0]['data']:
+            date = row[date_index]
+            if start_day[:10] <= date[:10] <= end_day[:10]:
+                rows[date] = row
+    merged = dict(contents[-1][0])
+    merged['data'] = [rows[date] for date in sorted(rows, reverse=True)]
+    return [merged]
+
+def get_historical_interday_range(universe, access_token, start_day, end_day, interval='P1D', fields=HISTORICAL_FIELDS, max_rows=MAX_ROWS, max_workers=rdp_client.POOL_MAXSIZE, cache=None):
+    """
+    This method requests a long Interday summaries range as concurrent server-sized chunks and merges them in order.
+    With a cache, the closed grid cells already stored locally are not requested again, only the missing cells
+    and the open tail of the latest cell.
+
+    Args:
+        universe (str): RIC Code
+        access_token (str): The access token
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        interval (str): The summaries interval (ISO 8601 duration)
+        fields (str or list of str): The interested field names
+        max_rows (int): Maximum number of rows per request
+        max_workers (int): Maximum number of concurrent requests
+        cache (HistoricalCache): The historical_cache.HistoricalCache object (optional)
+
+    Returns:
+        interday data (json): The merged Interday data content
+    """
+    def fetch(chunk):
+        chunk_start, chunk_end = chunk
+        if cache is not None:
+            return cache.get_historical_interday_data(universe, access_token, interval, chunk_start, chunk_end, fields, max_rows)
+        response = requests_historical.send_historical_interday_request(universe, access_token, interval, chunk_start, chunk_end, fields, max_rows)
+        response.raise_for_status()
+        return response.json()
+
+    chunks = split_range(start_day, end_day, interval, max_rows)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = list(executor.map(fetch, chunks))
+    return merge_chunks(contents, start_day, end_day)
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    universe = 'IBM.N'
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_historical.login_v1(username, password, app_key)
+
+        if access_token:
+            cache = HistoricalCache()
+            content = get_historical_interday_range(universe, access_token, '2015-01-01', '2025-02-10', interval='P1D', max_rows=1000, cache=cache)
+            print(f'Historical Pricing Inter-Day {universe}: {len(content[0]["data"]) if content else 0} rows')
+            cache.close()
+
+            print('Sending Logout request message to RDP')
+            requests_historical.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')
@@ -0,0 +1,220 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import codecs
+import json
+import re
+import rdp_config
+import requests_historical
+from historical_parser import parse_historical_pricing
+
+# Bytes read from the HTTP body at a time
+CHUNK_SIZE = 64 * 1024
+# Rows per record batch
+BATCH_SIZE = 10000
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_DECODER = json.JSONDecoder()
+
+class HistoricalEventStream:
+    """
+    This class decodes a RDP Historical Pricing response while its body is downloaded, the data rows are
+    given back one at a time or in fixed-size batches, so the memory use does not grow with the response size.
+    The top-level fields before the data rows (headers, universe, etc.) are available from the first row on,
+    the ones after them (meta) once all the rows are read.
+
+    Args:
+        response (requests.Response): The HTTP response sent with stream=True
+        chunk_size (int): Bytes read from the HTTP body at a time
+    """
+
+    def __init__(self, response, chunk_size=CHUNK_SIZE):
+        self.response = response
+        self.metadata = {}
+        self._chunks = response.iter_content(chunk_size)
+        self._decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.response.close()
+
+    @property
+    def headers(self):
+        return self.metadata.get('headers', [])
+
+    def rows(self):
+        """
+        This method yields the data rows as they are decoded.
+
+        Args:
+            None
+
+        Returns:
+            rows (generator): The data rows (list of values)
+        """
+        if self._started:
+            raise RuntimeError('The response is already read')
+        self._started = True
+        try:
+            # The response is a list with one object per RIC
+            self._expect('[')
+            if self._peek() == ']':
+                return
+            self._expect('{')
+            while self._peek() != '}':
+                key = self._value()
+                self._expect(':')
+                if key == 'data' and self._peek() != 'n':
+                    yield from self._array_items()
+                else:
+                    self.metadata[key] = self._value()
+                if self._peek() == ',':
+                    self._pos += 1
+            self._pos += 1
+        finally:
+            self.close()
+
+    def batches(self, size=BATCH_SIZE):
+        """
+        This method yields the data rows in fixed-size batches.
+
+        Args:
+            size (int): Rows per batch
+
+        Returns:
+            batches (generator): The lists of data rows
+        """
+        batch = []
+        for row in self.rows():
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def column_batches(self, size=BATCH_SIZE):
+        """
+        This method yields the data rows in fixed-size batches of typed NumPy columns.
+
+        Args:
+            size (int): Rows per batch
+
+        Returns:
+            batches (generator): The historical_parser.parse_historical_pricing() columns of each batch
+        """
+        for batch in self.batches(size):
+            yield parse_historical_pricing({'headers': self.headers, 'data': batch})
+
+    def _array_items(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f'Unexpected {separator!r} in the data rows')
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read()
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError('Unexpected end of the response')
+            self._read()
+
+    def _expect(self, char):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f'Expected {char!r}, found {found!r}')
+        self._pos += 1
+
+    def _read(self):
+        # Drop the decoded part, only the value in progress stays in memory
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._buffer += self._decoder.decode(b'', final=True)
+            self._eof = True
+        else:
+            self._buffer += self._decoder.decode(chunk)
+
+def get_historical_events_stream(universe, access_token, event_types='trade,correction', start=None, end=None, count=None, chunk_size=CHUNK_SIZE):
+    """
+    This method sends a HTTP request message to RDP Historical Pricing Service for getting Events data without reading the body.
+
+    Args:
+        universe (str): RIC Code
+        access_token (str): The access token
+        event_types (str): The event types separated by comma
+        start (str): The start timestamp in ISO 8601 format (optional)
+        end (str): The end timestamp in ISO 8601 format (optional)
+        count (int): Maximum number of rows (optional)
+        chunk_size (int): Bytes read from the HTTP body at a time
+
+    Returns:
+        stream (HistoricalEventStream): The stream of the response rows
+    """
+    response = requests_historical.send_historical_events_request(universe, access_token, event_types, start, end, count, stream=True)
+    if response.status_code != 200:
+        response.close()
+        response.raise_for_status()
+    return HistoricalEventStream(response, chunk_size)
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    universe = 'IBM.N'
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_historical.login_v1(username, password, app_key)
+
+        if access_token:
+            rows = corrections = 0
+            with get_historical_events_stream(universe, access_token, count=10000) as stream:
+                for columns in stream.column_batches(1000):
+                    rows += len(columns['EVENT_TYPE'])
+                    corrections += int((columns['EVENT_TYPE'] == 'correction').sum())
+            print(f'Historical Pricing Events {universe}: {rows} rows, {corrections} corrections')
+
+            print('Sending Logout request message to RDP')
+            requests_historical.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')
@@ -0,0 +1,126 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import importlib
+import json
+import os
+import time
+import timeit
+
+# The backends in order of preference, orjson is optional. simplejson (in requirements.txt) decodes slower than
+# the standard library json module, so it is used only when it is selected by name
+BACKENDS = ['orjson', 'json']
+
+_backend_name = None
+_loads = None
+
+def select_backend(name=None):
+    """
+    This method selects the JSON decoder, the first available of BACKENDS when no name is given.
+    The RDP_JSON_BACKEND environment variable sets the name of the initial selection.
+
+    Args:
+        name (str): 'orjson', 'simplejson' or 'json' (optional)
+
+    Returns:
+        name (str): The selected backend name
+    """
+    global _backend_name, _loads
+    for candidate in [name] if name else BACKENDS:
+        try:
+            module = importlib.import_module(candidate)
+        except ImportError:
+            if name:
+                raise
+            continue
+        _backend_name, _loads = candidate, module.loads
+        return candidate
+
+def backend_name():
+    if _loads is None:
+        select_backend(os.environ.get('RDP_JSON_BACKEND'))
+    return _backend_name
+
+def loads(data):
+    """
+    This method decodes a JSON document with the selected backend.
+
+    Args:
+        data (bytes or str): The JSON document
+
+    Returns:
+        content: The decoded content
+    """
+    if _loads is None:
+        select_backend(os.environ.get('RDP_JSON_BACKEND'))
+    return _loads(data)
+
+def install(response, on_decode=None):
+    """
+    This method makes response.json() decode the body once with the selected backend, the next calls return
+    the same decoded object. The calls with decoder parameters (e.g. object_hook) use the requests decoder.
+
+    Args:
+        response (requests.Response): The HTTP response
+        on_decode (function): Called with the decoding time in seconds after the first decode (optional)
+
+    Returns:
+        None
+    """
+    decode = response.json
+    decoded = []
+
+    def json_once(**kwargs):
+        if kwargs:
+            return decode(**kwargs)
+        if not decoded:
+            start = time.perf_counter()
+            try:
+                decoded.append(loads(response.content))
+            except ValueError:
+                # Same error type as requests for an invalid body
+                return decode()
+            if on_decode is not None:
+                on_decode(time.perf_counter() - start)
+        return decoded[0]
+
+    response.json = json_once
+
+if __name__ == '__main__':
+    import mock_rdp_server
+
+    payloads = {
+        'historical interday (10000 rows)': json.dumps(mock_rdp_server.historical_interday_response('IBM.N', 10000)).encode('utf-8'),
+        'historical events (50000 rows)': json.dumps(mock_rdp_server.historical_events_response('IBM.N', 50000)).encode('utf-8'),
+        'news headlines (100)': json.dumps(mock_rdp_server.news_headlines_response('R:IBM.N', 100)).encode('utf-8'),
+        'news story': json.dumps(mock_rdp_server.news_story_response('urn:newsml:mock:1')).encode('utf-8'),
+        'esg scores-standard (1000 RICs)': json.dumps(mock_rdp_server.esg_standard_response(','.join(f'RIC{i}.N' for i in range(1000)))).encode('utf-8'),
+        'auth token': json.dumps(mock_rdp_server.token_response(600, 1)).encode('utf-8')
+    }
+    backends = []
+    for name in BACKENDS + ['simplejson']:
+        try:
+            importlib.import_module(name)
+            backends.append(name)
+        except ImportError:
+            pass
+
+    print(f'{"payload":<34}{"size":>10}' + ''.join(f'{name:>14}' for name in backends))
+    for label, payload in payloads.items():
+        number = max(3, int(2000000 / len(payload)))
+        timings = []
+        for name in backends:
+            decoder = importlib.import_module(name).loads
+            timings.append(timeit.timeit(lambda: decoder(payload), number=number) / number * 1000)
+        print(f'{label:<34}{len(payload):>9}B' + ''.join(f'{timing:>12.3f}ms' for timing in timings))
+
+    # The old login functions decoded the token response three times
+    payload = payloads['auth token']
+    number = 100000
+    three = timeit.timeit(lambda: (json.loads(payload)['access_token'], json.loads(payload)['refresh_token'], json.loads(payload)['expires_in']), number=number)
+    once = timeit.timeit(lambda: loads(payload), number=number)
+    print(f'auth token, 3 x json decodes: {three / number * 1e6:.2f}us, 1 x {backend_name()} decode: {once / number * 1e6:.2f}us')
@@ -0,0 +1,84 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import importlib
+import sys
+import threading
+
+# Modules that take most of the Data Library scripts start up time, see benchmark_imports.py
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'httpx', 'watchdog']
+
+_import_lock = threading.RLock()
+
+class LazyModule:
+    """
+    This class stands for a module that is imported on the first attribute access, e.g. ld.open_session.
+
+    Args:
+        name (str): The module name, e.g. 'lseg.data' or 'lseg.data.content.esg'
+    """
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'imported' if self._module is not None else 'not imported'
+        return f'<lazy module {self._name!r} ({state})>'
+
+    def _load(self):
+        if self._module is None:
+            with _import_lock:
+                if self._module is None:
+                    self.__dict__['_module'] = importlib.import_module(self._name)
+        return self._module
+
+def lazy_import(name):
+    """
+    This method returns a module that is imported on the first attribute access, or the module itself if it is
+    already imported.
+
+    Args:
+        name (str): The module name
+
+    Returns:
+        module (LazyModule or module): The module
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+def preload(*names):
+    """
+    This method imports modules on a background thread, e.g. pandas while the session is opened, so the import
+    overlaps with the network round trips. Only preload third-party modules that do not import the calling code.
+
+    Args:
+        *names (str): The module names
+
+    Returns:
+        thread (threading.Thread): The started daemon thread
+    """
+    def run():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                # The error is raised again where the module is used
+                pass
+
+    thread = threading.Thread(target=run, name='preload', daemon=True)
+    thread.start()
+    return thread
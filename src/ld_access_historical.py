@@ -5,8 +5,10 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import lseg.data as ld
-from lseg.data import session
+import lazy_import
+import rdp_config
+
+ld = lazy_import.lazy_import('lseg.data')
 
 def get_historical_interday_data(universe, fields):
     """
@@ -38,6 +40,10 @@ if __name__ == '__main__':
     fields=['BID','ASK','OPEN_PRC','HIGH_1','LOW_1','TRDPRC_1','NUM_MOVES','TRNOVR_UNS']
     try:
         print('Open Session')
+        # Import pandas (DataFrame output) while the session is opened
+        lazy_import.preload('pandas')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
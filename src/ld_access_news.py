@@ -5,8 +5,10 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import lseg.data as ld
-from lseg.data import session
+import lazy_import
+import rdp_config
+
+ld = lazy_import.lazy_import('lseg.data')
 
 def get_news_headlines(universe):
     """
@@ -30,18 +32,22 @@ def get_news_headlines(universe):
     print(df)
     return df
 
-def get_news_story(story_id):
+def get_news_story(story_id, cache=None):
     """
     This method sends a request message to RDP News service to get news story data with the Data Library Access Layer.
 
     Args:
         story_id (str): Story ID code from news headlines.
+        cache (NewsStoryCache): The news_cache.NewsStoryCache object, the story is requested only if it is not cached (optional)
 
     Returns: 
         None.
     """
     # Send request message
-    story = ld.news.get_story(story_id, format=ld.news.Format.TEXT)
+    if cache is not None:
+        story = cache.get_or_fetch(story_id, lambda: ld.news.get_story(story_id, format=ld.news.Format.TEXT), ld.news.Format.TEXT)
+    else:
+        story = ld.news.get_story(story_id, format=ld.news.Format.TEXT)
     print(f'This is a News story from Data Library - Access Layer - get_story for {story_id}')
     print(story)
 
@@ -50,6 +56,10 @@ if __name__ == '__main__':
 
     try:
         print('Open Session')
+        # Import pandas (DataFrame output) while the session is opened
+        lazy_import.preload('pandas')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
@@ -5,16 +5,42 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import lseg.data as ld
-from lseg.data.content import esg
-from lseg.data import session
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import lazy_import
+import rdp_config
+
+ld = lazy_import.lazy_import('lseg.data')
+esg = lazy_import.lazy_import('lseg.data.content.esg')
+pd = lazy_import.lazy_import('pandas')
+requests_esg = lazy_import.lazy_import('requests_esg')
+
+# The DataFrame column titles (or field names) of the instrument and of the period
+INSTRUMENT_COLUMNS = ['Instrument', 'instrument']
+PERIOD_COLUMNS = ['Period End Date', 'periodenddate']
+
+def find_column(df, names):
+    """
+    This method returns the first column of the DataFrame with one of the names, ignoring the case.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame
+        names (list of str): The column names
+
+    Returns:
+        column (str): The column name
+    """
+    columns = {str(column).lower(): column for column in df.columns}
+    for name in names:
+        if name.lower() in columns:
+            return columns[name.lower()]
+    raise KeyError(f'None of the columns {names} in {list(df.columns)}')
 
 def get_esg_standard(universe):
     """
     This method sends a request message to RDP ESG service with the Data Library Content Layer and print data on a console.
 
     Args:
-        universe (str): RIC Code
+        universe (str or list of str): RIC Code(s)
 
     Returns: 
         None
@@ -27,11 +53,55 @@ def get_esg_standard(universe):
     #print(response.data)
     print(response.data.df)
 
+def get_esg_standard_batch(universe, batch_size=None, max_workers=None):
+    """
+    This method sends the ESG Standard requests of a large universe in batches concurrently with the Data Library Content Layer
+    and merges the results into one DataFrame.
+
+    Args:
+        universe (list of str): RIC Codes
+        batch_size (int): Maximum number of RICs per request (defaults to requests_esg.ESG_BATCH_SIZE)
+        max_workers (int): Maximum number of concurrent requests (defaults to the 'concurrency' setting, see rdp_config.py)
+
+    Returns: 
+        data (pandas.DataFrame): The ESG scores of all batches, one row per instrument and period
+        errors (dict): The exception keyed by RIC for the RICs of the failed batches
+    """
+    batch_size = batch_size or requests_esg.ESG_BATCH_SIZE
+    max_workers = max_workers or rdp_config.get('concurrency')
+    universe = list(dict.fromkeys(universe))
+    batches = [universe[index:index + batch_size] for index in range(0, len(universe), batch_size)]
+
+    frames = []
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(lambda batch: esg.standard_scores.Definition(batch).get_data().data.df, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                frames.append(future.result())
+            except Exception as exp:
+                errors.update(dict.fromkeys(futures[future], exp))
+    if not frames:
+        return pd.DataFrame(), errors
+    df = pd.concat(frames, ignore_index=True)
+    instrument, period = find_column(df, INSTRUMENT_COLUMNS), find_column(df, PERIOD_COLUMNS)
+    df = df.drop_duplicates(subset=[instrument, period], keep='last')
+    # In universe order, latest period first. The RICs the server returns in another form go last, as they are
+    order = {ric: index for index, ric in enumerate(universe)}
+    df = df.sort_values([instrument, period], ascending=[True, False])
+    df = df.sort_values(instrument, key=lambda column: column.map(order).fillna(len(order)), kind='stable', ignore_index=True)
+    print(f'ESG batch result from Data Library - Content Layer: {len(df)} rows, {len(errors)} RICs failed')
+    return df, errors
+
 if __name__ == '__main__':
     universe = 'IBM.N'
 
     try:
         print('Open Session')
+        # Import pandas (DataFrame output) while the session is opened
+        lazy_import.preload('pandas')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
@@ -5,12 +5,11 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
+import lazy_import
+import rdp_config
 
-import lseg.data as ld
-from lseg.data.content import historical_pricing
-from lseg.data.content.historical_pricing import Intervals
-from lseg.data.content.historical_pricing import Adjustments
-from lseg.data.content.historical_pricing import EventTypes
+ld = lazy_import.lazy_import('lseg.data')
+historical_pricing = lazy_import.lazy_import('lseg.data.content.historical_pricing')
 
 def get_historical_interday_data(universe, fields):
     """
@@ -27,7 +26,7 @@ def get_historical_interday_data(universe, fields):
     # Send request message
     response = historical_pricing.summaries.Definition(
         universe=universe,
-        interval= Intervals.WEEKLY,
+        interval= historical_pricing.Intervals.WEEKLY,
         count = 15,
         fields= fields
     ).get_data()
@@ -47,10 +46,10 @@ def get_historical_event_data(universe):
     # Send request message
     response = historical_pricing.events.Definition(
         universe=universe,
-        eventTypes= [EventTypes.TRADE, EventTypes.CORRECTION],
+        eventTypes= [historical_pricing.EventTypes.TRADE, historical_pricing.EventTypes.CORRECTION],
         adjustments= [
-            Adjustments.EXCHANGE_CORRECTION,
-            Adjustments.MANUAL_CORRECTION
+            historical_pricing.Adjustments.EXCHANGE_CORRECTION,
+            historical_pricing.Adjustments.MANUAL_CORRECTION
         ],
         count=15
     ).get_data()
@@ -63,6 +62,10 @@ if __name__ == '__main__':
     fields=['BID','ASK','OPEN_PRC','HIGH_1','LOW_1','TRDPRC_1','NUM_MOVES','TRNOVR_UNS']
     try:
         print('Open Session')
+        # Import pandas (DataFrame output) while the session is opened
+        lazy_import.preload('pandas')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
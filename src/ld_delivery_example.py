@@ -5,9 +5,14 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import lseg.data as ld
-from lseg.data import session
-from lseg.data.delivery import endpoint_request
+import lazy_import
+import rdp_config
+
+ld = lazy_import.lazy_import('lseg.data')
+# The Python requests stack of the resolver is imported only when it is used
+working_day_resolver = lazy_import.lazy_import('working_day_resolver')
+
+RDP_HOST = rdp_config.get('host')
 
 def get_analytics_working_day(codes, date):
     """
@@ -21,7 +26,7 @@ def get_analytics_working_day(codes, date):
         None
     """
 
-    analytic_url = 'https://api.refinitiv.com/analytics/functions/v1/common/is-working-day'
+    analytic_url = f'{RDP_HOST}/analytics/functions/v1/common/is-working-day'
 
     payload = {
         'universe': [{
@@ -41,6 +46,39 @@ def get_analytics_working_day(codes, date):
     print('This is a IS-Working-Day data result from Data Library - Delivery Layer - Endpoint method')
     print(response.data.raw)
 
+def post_analytics_working_day(payload):
+    """
+    This method sends a is-working-day request message with the Data Library Endpoint object.
+
+    Args:
+        payload (dict): The is-working-day request message, its universe can hold many calendar/date items
+
+    Returns: 
+        response (dict): The is-working-day response message
+    """
+    request = ld.delivery.endpoint_request.Definition(
+        url = f'{RDP_HOST}/analytics/functions/v1/common/is-working-day',
+        method= ld.delivery.endpoint_request.RequestMethod.POST,
+        body_parameters= payload
+    )
+    return request.get_data().data.raw
+
+def get_analytics_working_days(codes, year):
+    """
+    This method resolves every day of a year with batched is-working-day requests of the Data Library Endpoint object and print the result on a console.
+
+    Args:
+        codes (list of str): List of Country Codes
+        year (int): The year
+
+    Returns: 
+        resolver (working_day_resolver.WorkingDayResolver): The resolver that holds the answers, ask it for any other day without a new request
+    """
+    resolver = working_day_resolver.WorkingDayResolver(post_analytics_working_day)
+    working_days = resolver.precompute_year(codes, year)
+    print(f'This is a IS-Working-Day calendar result from Data Library - Delivery Layer - Endpoint method: {len(working_days)} working days in {year}')
+    return resolver
+
 def get_historical_event(universe):
     """
     This method sends a request message to RDP Historical Pricing service with the Data Library Endpoint object and print data on a console.
@@ -51,7 +89,7 @@ def get_historical_event(universe):
     Returns: 
         None
     """
-    historical_url = 'https://api.refinitiv.com/data/historical-pricing/v1/views/events/{universe}'
+    historical_url = f'{RDP_HOST}/data/historical-pricing/v1/views/events/{{universe}}'
 
     # Create request object
     request = ld.delivery.endpoint_request.Definition(
@@ -74,6 +112,8 @@ if __name__ == '__main__':
     day='2025-02-12'
     try:
         print('Open Session')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
@@ -84,6 +124,9 @@ if __name__ == '__main__':
         if str(session.open_state) == 'OpenState.Opened':
             get_analytics_working_day(country_codes, day)
             print()
+            resolver = get_analytics_working_days(country_codes, 2025)
+            print(f'{day} is a working day: {resolver.is_working_day(country_codes, day)}')
+            print()
             get_historical_event(universe)
 
         print('Close Session')
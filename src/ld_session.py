@@ -6,12 +6,16 @@
 # |-----------------------------------------------------------------------------
 
 import time
-import lseg.data as ld
-from lseg.data import session
+import lazy_import
+import rdp_config
+
+ld = lazy_import.lazy_import('lseg.data')
 
 if __name__ == '__main__':
     try:
         print('Open Session')
+        # The RDP_HOST, credentials and timeout overrides of the environment and of the 'rdp' section, see rdp_config.py
+        rdp_config.configure_ld()
         # Open the data session
         ld.open_session()
         #ld.open_session(config_name='./lseg-data.devrel.config.json')
@@ -0,0 +1,348 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import bisect
+import json
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+import rate_limiter
+
+# Record the RDP request metrics when enabled
+ENABLED = True
+
+# Histogram upper bounds of the phase durations (seconds) and of the payload sizes (bytes)
+DURATION_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864]
+
+# Request phases: connect (DNS resolution and TCP handshake), tls, ttfb (request sent until response headers),
+# download (response headers until body read), parse (JSON decoding) and total
+
+class Histogram:
+    """
+    This class counts observed values in cumulative buckets, like a Prometheus histogram.
+
+    Args:
+        buckets (list of float): The bucket upper bounds in ascending order
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class Registry:
+    """
+    This class holds the request metrics: the phase durations and payload sizes histograms and the response status counters.
+    An optional JSON lines file receives one line per request.
+
+    Args:
+        json_lines_path (str): The JSON lines file path (optional)
+    """
+
+    def __init__(self, json_lines_path=None):
+        self.durations = {}
+        self.sizes = {}
+        self.statuses = {}
+        self._lock = threading.Lock()
+        self._json_lines = open(json_lines_path, 'a', buffering=1) if json_lines_path else None
+
+    def close(self):
+        with self._lock:
+            if self._json_lines is not None:
+                self._json_lines.close()
+                self._json_lines = None
+
+    def record(self, family, method, status, phases, sizes):
+        """
+        This method records the metrics of one request.
+
+        Args:
+            family (str): The endpoint family, see rate_limiter.endpoint_family()
+            method (str): The HTTP method
+            status (int or str): The HTTP status code, 'error' if no response was received, None to not count a response
+            phases (dict): The duration in seconds keyed by phase
+            sizes (dict): The size in bytes keyed by direction ('request', 'response')
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for phase, seconds in phases.items():
+                key = (family, method, phase)
+                if key not in self.durations:
+                    self.durations[key] = Histogram(DURATION_BUCKETS)
+                self.durations[key].observe(seconds)
+            for direction, size in sizes.items():
+                key = (family, direction)
+                if key not in self.sizes:
+                    self.sizes[key] = Histogram(SIZE_BUCKETS)
+                self.sizes[key].observe(size)
+            if status is not None:
+                key = (family, method, str(status))
+                self.statuses[key] = self.statuses.get(key, 0) + 1
+            if self._json_lines is not None:
+                self._json_lines.write(json.dumps({'time': time.time(), 'family': family, 'method': method, 'status': status,
+                                                   'phases': phases, 'sizes': sizes}) + '\n')
+
+    def prometheus_text(self):
+        """
+        This method exports the metrics in the Prometheus text exposition format.
+
+        Args:
+            None
+
+        Returns:
+            text (str): The metrics
+        """
+        lines = []
+        with self._lock:
+            lines.append('# HELP rdp_request_phase_seconds RDP request phase duration in seconds.')
+            lines.append('# TYPE rdp_request_phase_seconds histogram')
+            for (family, method, phase), histogram in sorted(self.durations.items()):
+                _histogram_lines(lines, 'rdp_request_phase_seconds', f'family="{family}",method="{method}",phase="{phase}"', histogram)
+            lines.append('# HELP rdp_payload_bytes RDP request and response body size in bytes.')
+            lines.append('# TYPE rdp_payload_bytes histogram')
+            for (family, direction), histogram in sorted(self.sizes.items()):
+                _histogram_lines(lines, 'rdp_payload_bytes', f'family="{family}",direction="{direction}"', histogram)
+            lines.append('# HELP rdp_responses_total RDP responses by HTTP status code.')
+            lines.append('# TYPE rdp_responses_total counter')
+            for (family, method, status), count in sorted(self.statuses.items()):
+                lines.append(f'rdp_responses_total{{family="{family}",method="{method}",status="{status}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """
+        This method returns the current metrics as a JSON serializable dict.
+
+        Args:
+            None
+
+        Returns:
+            metrics (dict): The histograms and the status counters
+        """
+        def histogram_dict(histogram):
+            return {'buckets': dict(zip([str(bound) for bound in histogram.buckets] + ['+Inf'], histogram.counts)),
+                    'sum': histogram.sum, 'count': histogram.count}
+
+        with self._lock:
+            return {
+                'phases': [{'family': family, 'method': method, 'phase': phase, **histogram_dict(histogram)}
+                           for (family, method, phase), histogram in sorted(self.durations.items())],
+                'sizes': [{'family': family, 'direction': direction, **histogram_dict(histogram)}
+                          for (family, direction), histogram in sorted(self.sizes.items())],
+                'statuses': [{'family': family, 'method': method, 'status': status, 'count': count}
+                             for (family, method, status), count in sorted(self.statuses.items())]
+            }
+
+def _histogram_lines(lines, name, labels, histogram):
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+
+_registry = Registry()
+
+def get_registry():
+    return _registry
+
+def configure(enabled=None, json_lines_path=None):
+    """
+    This method enables or disables the metrics and resets the shared registry.
+
+    Args:
+        enabled (bool): Enable or disable the metrics (optional)
+        json_lines_path (str): Append one JSON line per request to this file (optional)
+
+    Returns:
+        None
+    """
+    global ENABLED, _registry
+    if enabled is not None:
+        ENABLED = enabled
+    old_registry, _registry = _registry, Registry(json_lines_path)
+    old_registry.close()
+
+# The connect and TLS phases are measured in the urllib3 connection, on the thread that sends the request
+_connection_phases = threading.local()
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        start = time.perf_counter()
+        sock = super()._new_conn()
+        _connection_phases.connect = time.perf_counter() - start
+        return sock
+
+    def connect(self):
+        _connection_phases.connect = 0
+        start = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - start
+        _connection_phases.tls = max(0, elapsed - _connection_phases.connect) if isinstance(self, HTTPSConnection) else 0
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    This class is a requests HTTPAdapter whose new connections record their connect and TLS handshake durations.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+def begin_request():
+    """
+    This method clears the connection phases of the current thread before a request is sent.
+
+    Args:
+        None
+
+    Returns:
+        start (float): The perf_counter() start time
+    """
+    _connection_phases.connect = None
+    _connection_phases.tls = None
+    return time.perf_counter()
+
+def record_response(url, method, start, response=None):
+    """
+    This method records the metrics of a requests response (or of a failed request).
+
+    Args:
+        url (str): The RDP endpoint URL
+        method (str): The HTTP method
+        start (float): The begin_request() start time
+        response (requests.Response): The HTTP response, None if the request failed
+
+    Returns:
+        None
+    """
+    total = time.perf_counter() - start
+    family = rate_limiter.endpoint_family(url)
+    method = method.upper()
+    phases = {'total': total}
+    connect = getattr(_connection_phases, 'connect', None)
+    if connect is not None:
+        phases['connect'] = connect
+        phases['tls'] = _connection_phases.tls or 0
+    sizes = {}
+    if response is None:
+        get_registry().record(family, method, 'error', phases, sizes)
+        return
+
+    # requests measures elapsed until the response headers are parsed
+    ttfb = response.elapsed.total_seconds()
+    phases['ttfb'] = max(0, ttfb - phases.get('connect', 0) - phases.get('tls', 0))
+    phases['download'] = max(0, total - ttfb)
+    body = response.request.body
+    sizes['request'] = len(body) if body else 0
+    if response._content_consumed:
+        sizes['response'] = len(response.content)
+    elif response.headers.get('Content-Length', '').isdigit():
+        sizes['response'] = int(response.headers['Content-Length'])
+    get_registry().record(family, method, response.status_code, phases, sizes)
+
+class HttpxTrace:
+    """
+    This class collects the phase timings of one httpx request from its 'trace' extension events.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self._started = {}
+
+    async def __call__(self, event_name, info):
+        # e.g. connection.connect_tcp.started, http11.receive_response_headers.complete
+        step, _, state = event_name.rpartition('.')
+        now = time.perf_counter()
+        if state == 'started':
+            self._started[step] = now
+        elif state in ('complete', 'failed') and step in self._started:
+            elapsed = now - self._started.pop(step)
+            if step.endswith('connect_tcp'):
+                self.phases['connect'] = elapsed
+            elif step.endswith('start_tls'):
+                self.phases['tls'] = elapsed
+            elif step.endswith('send_request_headers') or step.endswith('send_request_body') or step.endswith('receive_response_headers'):
+                self.phases['ttfb'] = self.phases.get('ttfb', 0) + elapsed
+            elif step.endswith('receive_response_body'):
+                self.phases['download'] = elapsed
+
+def record_httpx_response(url, method, start, trace, response=None):
+    """
+    This method records the metrics of a httpx response (or of a failed request).
+
+    Args:
+        url (str): The RDP endpoint URL
+        method (str): The HTTP method
+        start (float): The begin_request() start time
+        trace (HttpxTrace): The trace extension of the request
+        response (httpx.Response): The HTTP response, None if the request failed
+
+    Returns:
+        None
+    """
+    phases = dict(trace.phases, total=time.perf_counter() - start)
+    family = rate_limiter.endpoint_family(url)
+    if response is None:
+        get_registry().record(family, method.upper(), 'error', phases, {})
+        return
+    sizes = {'request': len(response.request.content or b''), 'response': len(response.content)}
+    get_registry().record(family, method.upper(), response.status_code, phases, sizes)
+
+def record_parse(url, method, seconds):
+    """
+    This method records the JSON decoding time of a response as its parse phase.
+
+    Args:
+        url (str): The RDP endpoint URL
+        method (str): The HTTP method
+        seconds (float): The decoding time
+
+    Returns:
+        None
+    """
+    get_registry().record(rate_limiter.endpoint_family(url), method.upper(), None, {'parse': seconds}, {})
+
+if __name__ == '__main__':
+    # The request modules record into the imported metrics module, not into __main__
+    import metrics
+    import mock_rdp_server
+    import requests_historical
+    import requests_news
+
+    server, base_url = mock_rdp_server.start_server(latency=0.005)
+    requests_historical.RDP_HOST = requests_news.RDP_HOST = base_url
+    access_token, refresh_token, expires_in = requests_historical.login_v1('metrics', 'metrics', 'metrics')
+    for _ in range(20):
+        requests_historical.send_historical_interday_request('IBM.N', access_token).json()
+        requests_news.send_news_headlines_request('R:IBM.N', access_token).json()
+    requests_historical.logout('metrics', access_token)
+    print(metrics.get_registry().prometheus_text())
+    server.shutdown()
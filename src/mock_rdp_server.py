@@ -0,0 +1,441 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import argparse
+import base64
+import datetime
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from rate_limiter import endpoint_family
+
+# Number of headlines the News headlines endpoint returns for any query
+NEWS_HEADLINES_TOTAL = 250
+
+# Number of days between two Interday summaries rows of each interval
+HISTORICAL_INTERVAL_DAYS = {'P1D': 1, 'P7D': 7, 'P1W': 7, 'P1M': 30, 'P3M': 91, 'P12M': 365, 'P1Y': 365}
+
+HISTORICAL_HEADERS = [
+    {'name': 'DATE', 'type': 'string'},
+    {'name': 'BID', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'ASK', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'OPEN_PRC', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'HIGH_1', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'LOW_1', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'TRDPRC_1', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'NUM_MOVES', 'type': 'number', 'decimalChar': '.'},
+    {'name': 'TRNOVR_UNS', 'type': 'number', 'decimalChar': '.'}
+]
+
+def token_response(expires_in=600, version=1):
+    """
+    This method builds a RDP Authentication Service token response message.
+
+    Args:
+        expires_in (int): The token lifetime in seconds
+        version (int): The Authentication Service version (V2 does not return a refresh token)
+
+    Returns:
+        response (dict): The token response message
+    """
+    response = {
+        'access_token': uuid.uuid4().hex,
+        'expires_in': str(expires_in),
+        'scope': 'trapi',
+        'token_type': 'Bearer'
+    }
+    if version == 1:
+        response['refresh_token'] = uuid.uuid4().hex
+    return response
+
+def historical_interday_response(universe, count, fields=None, start=None, end=None, interval='P1D'):
+    """
+    This method builds a RDP Historical Pricing Interday summaries response message, one row per interval
+    from the end date back to the start date (newest first).
+
+    Args:
+        universe (str): RIC Code
+        count (int): Maximum number of rows
+        fields (str): The interested field names separated by comma (optional, all fields)
+        start (str): The start date in YYYY-MM-DD format (optional, no lower bound)
+        end (str): The end date in YYYY-MM-DD format (optional, 2025-02-10)
+        interval (str): The summaries interval, e.g. 'P1D' or 'P1W' (optional, daily)
+
+    Returns:
+        response (list): The Interday summaries response message
+    """
+    step = datetime.timedelta(days=HISTORICAL_INTERVAL_DAYS.get(interval or 'P1D', 1))
+    first = datetime.date.fromisoformat(start[:10]) if start else datetime.date.min + step
+    day = datetime.date.fromisoformat(end[:10]) if end else datetime.date(2025, 2, 10)
+    data = []
+    while len(data) < count and day >= first:
+        # The prices depend only on the date, so overlapping requests return the same rows
+        price = 250.0 + (day.toordinal() % 1000) / 10
+        data.append([day.isoformat(), price, price + 0.05, price - 1.2, price + 2.3,
+                     price - 2.1, price + 0.4, 180000 + day.toordinal() % 1000, 4.5e9 + day.toordinal()])
+        day -= step
+    headers = HISTORICAL_HEADERS
+    if fields:
+        wanted = set(fields.split(','))
+        # DATE is always the first column, also when it is in the requested fields
+        indexes = [0] + [i for i, header in enumerate(HISTORICAL_HEADERS) if i > 0 and header['name'] in wanted]
+        headers = [HISTORICAL_HEADERS[i] for i in indexes]
+        data = [[row[i] for i in indexes] for row in data]
+    return [{
+        'universe': {'ric': universe},
+        'interval': interval or 'P1D',
+        'summaryTimestampLabel': 'endPeriod',
+        'adjustments': ['exchangeCorrection', 'manualCorrection', 'CCH', 'CRE', 'RTS', 'RPO'],
+        'defaultPricingField': 'TRDPRC_1',
+        'qos': {'timeliness': 'delayed'},
+        'headers': headers,
+        'data': data
+    }]
+
+def historical_events_response(universe, count):
+    """
+    This method builds a RDP Historical Pricing events response message.
+
+    Args:
+        universe (str): RIC Code
+        count (int): Number of rows
+
+    Returns:
+        response (list): The events response message
+    """
+    start = datetime.datetime(2025, 2, 10, 21, 0, 0)
+    data = []
+    for i in range(count):
+        timestamp = (start - datetime.timedelta(milliseconds=250 * i)).isoformat(timespec='milliseconds') + 'Z'
+        event_type = 'correction' if i % 50 == 49 else 'trade'
+        data.append([timestamp, event_type, None, None, None, 250.0 + (i % 7) * 0.01, 100 * (1 + i % 5),
+                     None, None, None, None, '132;', None, 'NYS', None, i + 1, None])
+    headers = [{'name': 'DATE_TIME', 'type': 'string'}, {'name': 'EVENT_TYPE', 'type': 'string'},
+               {'name': 'RTL', 'type': 'number', 'decimalChar': '.'}, {'name': 'SOURCE_DATETIME', 'type': 'string'},
+               {'name': 'SEQNUM', 'type': 'number', 'decimalChar': '.'}, {'name': 'TRDPRC_1', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'TRDVOL_1', 'type': 'number', 'decimalChar': '.'}, {'name': 'BID', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'BIDSIZE', 'type': 'number', 'decimalChar': '.'}, {'name': 'ASK', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'ASKSIZE', 'type': 'number', 'decimalChar': '.'}, {'name': 'QUALIFIERS', 'type': 'string'},
+               {'name': 'PCTCHNG', 'type': 'number', 'decimalChar': '.'}, {'name': 'OFF_CODE', 'type': 'string'},
+               {'name': 'TRNOVR_UNS', 'type': 'number', 'decimalChar': '.'}, {'name': 'NUM_MOVES', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'VWAP', 'type': 'number', 'decimalChar': '.'}]
+    return [{
+        'universe': {'ric': universe},
+        'adjustments': ['exchangeCorrection', 'manualCorrection'],
+        'defaultPricingField': 'TRDPRC_1',
+        'qos': {'timeliness': 'delayed'},
+        'headers': headers,
+        'data': data,
+        'meta': {'blendingEntry': {'headers': [], 'data': []}}
+    }]
+
+def news_headlines_response(query, limit, cursor=None, total=NEWS_HEADLINES_TOTAL):
+    """
+    This method builds a RDP News headlines response message, the pages are linked with the meta.next cursor.
+    The story IDs depend only on the headline position, so different queries share stories.
+
+    Args:
+        query (str): The news query
+        limit (int): Number of headlines per page
+        cursor (str): The page cursor (optional, first page)
+        total (int): Number of headlines of the query
+
+    Returns:
+        response (dict): The News headlines response message
+    """
+    offset = int(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii')) if cursor else 0
+    data = []
+    for i in range(offset, min(offset + limit, total)):
+        story_id = f'urn:newsml:reuters.com:20250210:nL1N3OX{i:04d}:1'
+        created = (datetime.datetime(2025, 2, 10, 23, 59) - datetime.timedelta(minutes=i)).isoformat(timespec='milliseconds') + 'Z'
+        data.append({
+            'storyId': story_id,
+            'newsItem': {
+                '_conformance': 'power',
+                '_guid': story_id.rsplit(':', 1)[0],
+                '_standard': 'NewsML-G2',
+                '_version': 1,
+                'contentMeta': {
+                    'creator': [{'_qcode': 'NS:RTRS', '_role': 'sRole:source'}],
+                    'infoSource': [{'_qcode': 'NS:RTRS', '_role': 'sRole:source'}],
+                    'language': [{'_tag': 'en'}],
+                    'subject': [{'_qcode': 'R:IBM.N'}, {'_qcode': 'B:1'}],
+                    'urgency': {'$': 3}
+                },
+                'itemMeta': {
+                    'firstCreated': {'$': created},
+                    'versionCreated': {'$': created},
+                    'title': [{'$': f'Mock headline {i} for {query}'}]
+                }
+            }
+        })
+    meta = {'count': len(data), 'pageLimit': limit}
+    if offset + limit < total:
+        meta['next'] = base64.urlsafe_b64encode(str(offset + limit).encode('ascii')).decode('ascii')
+    if offset > 0:
+        meta['prev'] = base64.urlsafe_b64encode(str(max(0, offset - limit)).encode('ascii')).decode('ascii')
+    return {'data': data, 'meta': meta}
+
+def news_story_response(story_id):
+    """
+    This method builds a RDP News story response message.
+
+    Args:
+        story_id (str): Story ID code
+
+    Returns:
+        response (dict): The News story response message
+    """
+    created = '2025-02-10T23:59:00.000Z'
+    return {
+        'newsItem': {
+            '_conformance': 'power',
+            '_guid': story_id,
+            '_standard': 'NewsML-G2',
+            '_version': 1,
+            'contentMeta': {
+                'creator': [{'_qcode': 'NS:RTRS', '_role': 'sRole:source'}],
+                'infoSource': [{'_qcode': 'NS:RTRS', '_role': 'sRole:source'}],
+                'language': [{'_tag': 'en'}],
+                'subject': [{'_qcode': 'R:IBM.N'}, {'_qcode': 'B:1'}],
+                'urgency': {'$': 3},
+                'headline': [{'$': f'Mock story {story_id}'}]
+            },
+            'contentSet': {'inlineData': [{'$': 'Mock story body. ' * 50, '_type': 'text/plain'}]},
+            'itemMeta': {
+                'firstCreated': {'$': created},
+                'versionCreated': {'$': created},
+                'title': [{'$': f'Mock story {story_id}'}]
+            }
+        }
+    }
+
+def esg_standard_response(universe):
+    """
+    This method builds a RDP ESG scores-standard response message.
+
+    Args:
+        universe (str): RIC Codes separated by comma
+
+    Returns:
+        response (dict): The ESG scores-standard response message
+    """
+    headers = [{'name': 'instrument', 'title': 'Instrument', 'type': 'string'},
+               {'name': 'periodenddate', 'title': 'Period End Date', 'type': 'string'},
+               {'name': 'ESGScore', 'title': 'ESG Score', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'EnvironmentPillarScore', 'title': 'Environment Pillar Score', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'SocialPillarScore', 'title': 'Social Pillar Score', 'type': 'number', 'decimalChar': '.'},
+               {'name': 'GovernancePillarScore', 'title': 'Governance Pillar Score', 'type': 'number', 'decimalChar': '.'}]
+    data = []
+    for ric in universe.split(','):
+        for year in range(2023, 2019, -1):
+            data.append([ric, f'{year}-12-31', 70.1, 65.2, 80.3, 60.4])
+    return {'links': {'count': len(data)}, 'headers': headers, 'data': data}
+
+def is_working_day_response(body):
+    """
+    This method builds a RDP Analytics is-working-day response message, weekends are non-working days.
+
+    Args:
+        body (dict): The is-working-day request message
+
+    Returns:
+        response (dict): The is-working-day response message
+    """
+    data = []
+    for item in body.get('universe', []):
+        date = datetime.date.fromisoformat(item['calculationDate'])
+        data.append({
+            'calendarCodes': item.get('calendarCodes', []),
+            'calculationDate': item['calculationDate'],
+            'isWeekEnd': date.weekday() >= 5,
+            'isWorkingDay': date.weekday() < 5
+        })
+    return {'data': data}
+
+class MockRDPRequestHandler(BaseHTTPRequestHandler):
+    """
+    This class handles HTTP request messages to the local RDP stand-in server.
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length', 0))
+        return self.rfile.read(length) if length else b''
+
+    def _inject_faults(self, path):
+        """
+        This method applies the server latency, throttling and error rate settings.
+
+        Returns:
+            handled (bool): True if a fault response was sent
+        """
+        server = self.server
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if not server.acquire(endpoint_family(path)):
+            self._send_json(429, {'error': {'code': '429', 'message': 'Too many requests, please try again later.'}},
+                            {'Retry-After': str(server.retry_after)})
+            return True
+        if server.error_rate and random.random() < server.error_rate:
+            self._send_json(503, {'error': {'code': '503', 'message': 'Service Unavailable'}})
+            return True
+        return False
+
+    def _authorized(self):
+        if self.headers.get('Authorization', '').startswith('Bearer '):
+            return True
+        self._send_json(401, {'error': {'id': uuid.uuid4().hex, 'code': '401', 'message': 'token expired'}})
+        return False
+
+    def do_POST(self):
+        body = self._read_body()
+        path = urlparse(self.path).path
+        if self._inject_faults(path):
+            return
+        if path == '/auth/oauth2/v1/token':
+            self._send_json(200, token_response(self.server.expires_in, version=1))
+        elif path == '/auth/oauth2/v2/token':
+            self._send_json(200, token_response(self.server.expires_in, version=2))
+        elif path == '/auth/oauth2/v1/revoke':
+            self._send_json(200, {})
+        elif path == '/analytics/functions/v1/common/is-working-day':
+            if self._authorized():
+                self._send_json(200, is_working_day_response(json.loads(body or b'{}')))
+        else:
+            self._send_json(404, {'error': {'message': f'Not found: {path}'}})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        if self._inject_faults(path) or not self._authorized():
+            return
+
+        if path.startswith('/data/historical-pricing/v1/views/interday-summaries/'):
+            universe = path.rsplit('/', 1)[-1]
+            self._send_json(200, historical_interday_response(universe, int(query.get('count', 15)), query.get('fields'),
+                                                                  query.get('start'), query.get('end'), query.get('interval')))
+        elif path.startswith('/data/historical-pricing/v1/views/events/'):
+            universe = path.rsplit('/', 1)[-1]
+            self._send_json(200, historical_events_response(universe, int(query.get('count', 20))))
+        elif path == '/data/news/v1/headlines':
+            self._send_json(200, news_headlines_response(query.get('query', ''), int(query.get('limit', 10)), query.get('cursor')))
+        elif path.startswith('/data/news/v1/stories/'):
+            self._send_json(200, news_story_response(path.rsplit('/', 1)[-1]))
+        elif path == '/data/environmental-social-governance/v2/views/scores-standard':
+            self._send_json(200, esg_standard_response(query.get('universe', '')))
+        else:
+            self._send_json(404, {'error': {'message': f'Not found: {path}'}})
+
+class MockRDPServer(ThreadingHTTPServer):
+    """
+    This class is the local RDP stand-in server, it serves each connection on its own thread.
+
+    Args:
+        server_address (tuple): The listening (host, port)
+        latency (float): Fixed delay added to every response in seconds
+        jitter (float): Maximum random delay added on top of the latency in seconds
+        error_rate (float): Ratio (0-1) of requests that get HTTP 503
+        throttle (int): Maximum requests per second per endpoint family before HTTP 429 (None is unlimited)
+        retry_after (int): The Retry-After header value of HTTP 429 responses in seconds
+        expires_in (int): The access token lifetime in seconds
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, latency=0, jitter=0, error_rate=0, throttle=None, retry_after=1, expires_in=600):
+        super().__init__(server_address, MockRDPRequestHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.expires_in = expires_in
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, family):
+        """
+        This method counts the request in the current one-second window of the endpoint family.
+
+        Args:
+            family (str): The endpoint family name
+
+        Returns:
+            allowed (bool): False if the request must be throttled
+        """
+        if not self.throttle:
+            return True
+        window = int(time.monotonic())
+        with self._lock:
+            current, count = self._windows.get(family, (window, 0))
+            if current != window:
+                count = 0
+            self._windows[family] = (window, count + 1)
+        return count < self.throttle
+
+def start_server(host='127.0.0.1', port=0, **options):
+    """
+    This method starts the local RDP stand-in server on a background thread.
+
+    Args:
+        host (str): The listening address
+        port (int): The listening port (0 picks a free port)
+        **options: The MockRDPServer fault injection settings (latency, jitter, error_rate, throttle, retry_after, expires_in)
+
+    Returns:
+        server (MockRDPServer): The running server object
+        base_url (str): The server base URL to use as RDP_HOST
+    """
+    server = MockRDPServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://{server.server_address[0]}:{server.server_address[1]}'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local RDP stand-in server for offline load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0, help='Fixed delay per response in seconds')
+    parser.add_argument('--jitter', type=float, default=0, help='Maximum random extra delay in seconds')
+    parser.add_argument('--error-rate', type=float, default=0, help='Ratio (0-1) of requests that get HTTP 503')
+    parser.add_argument('--throttle', type=int, default=None, help='Requests per second per endpoint family before HTTP 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After value of HTTP 429 responses in seconds')
+    parser.add_argument('--expires-in', type=int, default=600, help='Access token lifetime in seconds')
+    args = parser.parse_args()
+
+    server = MockRDPServer((args.host, args.port), latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           throttle=args.throttle, retry_after=args.retry_after, expires_in=args.expires_in)
+    print(f'Mock RDP server is running on http://{args.host}:{args.port}')
+    print(f'Set RDP_HOST=http://{args.host}:{args.port} to point the examples to it')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print('Shutdown Mock RDP server')
+        server.server_close()
@@ -0,0 +1,167 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+
+# Default in-memory size budget in bytes
+MAX_BYTES = 64 * 1024 * 1024
+
+def format_name(story_format):
+    """
+    This method returns the cache name of a story format ('json', or a Data Library news Format value).
+
+    Args:
+        story_format (str or Enum): The story format, e.g. 'json' or ld.news.Format.TEXT
+
+    Returns:
+        name (str): The lower case format name
+    """
+    return str(getattr(story_format, 'name', story_format)).lower()
+
+class NewsStoryCache:
+    """
+    This class is a thread-safe LRU cache of news stories keyed by story ID and format, with a size budget in bytes.
+    News stories do not change once published, so entries never expire. When a spill directory is set, the entries
+    evicted from memory, and the entries larger than the whole budget, are written there zlib-compressed and loaded
+    back on the next access.
+
+    Args:
+        max_bytes (int): The in-memory size budget in bytes
+        spill_dir (str): The directory of the compressed on-disk store (optional)
+    """
+
+    def __init__(self, max_bytes=MAX_BYTES, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, story_id, story_format='json'):
+        """
+        This method returns the cached story.
+
+        Args:
+            story_id (str): Story ID code
+            story_format (str or Enum): The story format
+
+        Returns:
+            story: The story content (dict for JSON, str for text), or None
+        """
+        key = (story_id, format_name(story_format))
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._decode(key, payload)
+        payload = self._read_spill(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            evicted = self._store(key, payload)
+        for evicted_key, evicted_payload in evicted:
+            self._write_spill(evicted_key, evicted_payload)
+        return self._decode(key, payload)
+
+    def put(self, story_id, story, story_format='json'):
+        """
+        This method stores the story.
+
+        Args:
+            story_id (str): Story ID code
+            story: The story content (dict for JSON, str for text)
+            story_format (str or Enum): The story format
+
+        Returns:
+            None
+        """
+        key = (story_id, format_name(story_format))
+        payload = json.dumps(story, separators=(',', ':')).encode('utf-8') if key[1] == 'json' else str(story).encode('utf-8')
+        with self._lock:
+            evicted = self._store(key, payload)
+        for evicted_key, evicted_payload in evicted:
+            self._write_spill(evicted_key, evicted_payload)
+
+    def get_or_fetch(self, story_id, fetch, story_format='json'):
+        """
+        This method returns the cached story, or calls the fetch function and stores its result.
+
+        Args:
+            story_id (str): Story ID code
+            fetch (function): The function that requests the story
+            story_format (str or Enum): The story format
+
+        Returns:
+            story: The story content
+        """
+        story = self.get(story_id, story_format)
+        if story is None:
+            story = fetch()
+            if story is not None:
+                self.put(story_id, story, story_format)
+        return story
+
+    def _decode(self, key, payload):
+        text = payload.decode('utf-8')
+        return json.loads(text) if key[1] == 'json' else text
+
+    def _store(self, key, payload):
+        # Must be called with the lock held, returns the evicted entries
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        if len(payload) > self.max_bytes:
+            # Never kept in memory, it would evict every other entry
+            return [(key, payload)]
+        self._entries[key] = payload
+        self.size += len(payload)
+        evicted = []
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            evicted_key, evicted_payload = self._entries.popitem(last=False)
+            self.size -= len(evicted_payload)
+            evicted.append((evicted_key, evicted_payload))
+        return evicted
+
+    def _spill_path(self, key):
+        name = hashlib.sha1(f'{key[1]}:{key[0]}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.spill_dir, f'{name}.z')
+
+    def _write_spill(self, key, payload):
+        if not self.spill_dir:
+            return
+        path = self._spill_path(key)
+        if os.path.exists(path):
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.spill_dir)
+        with os.fdopen(fd, 'wb') as spill_file:
+            spill_file.write(zlib.compress(payload))
+        os.replace(temp_path, path)
+
+    def _read_spill(self, key):
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), 'rb') as spill_file:
+                return zlib.decompress(spill_file.read())
+        except (OSError, zlib.error):
+            return None
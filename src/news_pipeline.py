@@ -0,0 +1,139 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import rdp_client
+import rdp_config
+import requests_news
+from news_cache import NewsStoryCache
+
+# Default number of concurrent story requests
+MAX_WORKERS = rdp_client.POOL_MAXSIZE
+# Headlines per page
+PAGE_LIMIT = 100
+
+def fetch_story(story_id, access_token):
+    """
+    This method requests a news story and raises an exception on failure.
+
+    Args:
+        story_id (str): Story ID code from news headlines
+        access_token (str): The access token
+
+    Returns:
+        news story (json): The News Story content
+    """
+    response = requests_news.send_news_story_request(story_id, access_token)
+    response.raise_for_status()
+    return response.json()
+
+class NewsStoryPipeline:
+    """
+    This class pages through the news headlines of queries and prefetches their stories concurrently.
+    The story IDs already seen (in this or a previous query) are not requested again.
+
+    Args:
+        access_token (str): The access token
+        max_workers (int): Maximum number of concurrent story requests
+        max_in_flight (int): Maximum number of story requests queued or running (defaults to 2 x max_workers)
+        seen (set): The story IDs already processed, shared between queries (optional)
+        cache (NewsStoryCache): The news_cache.NewsStoryCache object to read from and store to (optional)
+    """
+
+    def __init__(self, access_token, max_workers=MAX_WORKERS, max_in_flight=None, seen=None, cache=None):
+        self.access_token = access_token
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or max_workers * 2
+        self.seen = seen if seen is not None else set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-story')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_story(self, story_id):
+        if self.cache is None:
+            return fetch_story(story_id, self.access_token)
+        return self.cache.get_or_fetch(story_id, lambda: fetch_story(story_id, self.access_token))
+
+    def stories(self, query, limit=PAGE_LIMIT, max_headlines=None):
+        """
+        This method yields the stories of a query as soon as each one arrives, while the next headline pages are requested.
+
+        Args:
+            query (str): The news query
+            limit (int): Headlines per page
+            max_headlines (int): Stop after this many headlines (optional)
+
+        Returns:
+            stories (generator): The (story ID, headline, story content or exception) tuples in completion order
+        """
+        in_flight = {}
+
+        def drain(return_when):
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                story_id, headline = in_flight.pop(future)
+                try:
+                    yield story_id, headline, future.result()
+                except Exception as exp:
+                    # Let a later query try this story again
+                    self.seen.discard(story_id)
+                    yield story_id, headline, exp
+
+        for headline in requests_news.iter_news_headlines(query, self.access_token, limit, max_headlines):
+            story_id = headline.get('storyId')
+            if not story_id or story_id in self.seen:
+                continue
+            self.seen.add(story_id)
+            while len(in_flight) >= self.max_in_flight:
+                yield from drain(FIRST_COMPLETED)
+            in_flight[self._executor.submit(self._fetch_story, story_id)] = (story_id, headline)
+            # Give back the completed stories without waiting
+            if any(future.done() for future in in_flight):
+                yield from drain(FIRST_COMPLETED)
+        while in_flight:
+            yield from drain(FIRST_COMPLETED)
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    universe = ['IBM.N', 'MSFT.O', 'AAPL.O']
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_news.login_v1(username, password, app_key)
+
+        if access_token:
+            start = time.perf_counter()
+            received = failed = 0
+            cache = NewsStoryCache(spill_dir=rdp_config.get('cache.news-dir'))
+            with NewsStoryPipeline(access_token, cache=cache) as pipeline:
+                for ric in universe:
+                    query = f'R:{ric} AND Language:LEN AND Source:RTRS'
+                    for story_id, headline, story in pipeline.stories(query, max_headlines=200):
+                        if isinstance(story, Exception):
+                            failed += 1
+                        else:
+                            received += 1
+            elapsed = time.perf_counter() - start
+            print(f'News stories: {received} received, {failed} failed, {len(pipeline.seen)} unique in {elapsed:.2f}s')
+            print(f'News story cache: {cache.hits} hits, {cache.misses} misses, {cache.size} bytes in memory')
+
+            print('Sending Logout request message to RDP')
+            requests_news.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')
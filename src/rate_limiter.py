@@ -0,0 +1,187 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Set to False to send requests without client-side throttling
+ENABLED = True
+
+# Requests per second budget for each RDP endpoint family
+BUDGETS = {
+    'auth': 5,
+    'historical-pricing': 20,
+    'news': 10,
+    'esg': 5,
+    'analytics': 10,
+    'default': 10
+}
+
+# URL path prefix of each RDP endpoint family
+ENDPOINT_FAMILIES = [
+    ('/auth/', 'auth'),
+    ('/data/historical-pricing/', 'historical-pricing'),
+    ('/data/news/', 'news'),
+    ('/data/environmental-social-governance/', 'esg'),
+    ('/analytics/', 'analytics')
+]
+
+# The rate is halved on HTTP 429 and increased by this ratio of the budget per successful response
+DECREASE_FACTOR = 0.5
+INCREASE_RATIO = 0.05
+MIN_RATE_RATIO = 0.05
+
+class TokenBucket:
+    """
+    This class is a thread-safe token bucket that adapts its rate downward on HTTP 429 (AIMD).
+
+    Args:
+        rate (float): The maximum number of requests per second
+        burst (float): The bucket capacity (defaults to rate)
+    """
+
+    def __init__(self, rate, burst=None):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst or rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        This method takes one token from the bucket and returns how long the caller must wait before sending.
+
+        Args:
+            None
+
+        Returns:
+            wait time (float): The wait time in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self):
+        """
+        This method blocks the calling thread until a token is available.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, status_code, retry_after=None):
+        """
+        This method adapts the rate from the HTTP response status.
+
+        Args:
+            status_code (int): The HTTP status code
+            retry_after (str): The Retry-After response header value (optional)
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if status_code == 429:
+                self.rate = max(self.max_rate * MIN_RATE_RATIO, self.rate * DECREASE_FACTOR)
+                self._tokens = min(self._tokens, 0)
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            elif status_code < 400 and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * INCREASE_RATIO)
+
+def parse_retry_after(value):
+    """
+    This method converts a Retry-After header value (delay-seconds or HTTP-date) to seconds.
+
+    Args:
+        value (str): The Retry-After header value
+
+    Returns:
+        delay (float): The delay in seconds, or None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def endpoint_family(url):
+    """
+    This method returns the RDP endpoint family name of the URL.
+
+    Args:
+        url (str): The RDP endpoint URL
+
+    Returns:
+        family (str): The endpoint family name
+    """
+    path = urlparse(url).path
+    for prefix, family in ENDPOINT_FAMILIES:
+        if path.startswith(prefix):
+            return family
+    return 'default'
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+def get_limiter(url):
+    """
+    This method returns the shared token bucket of the URL endpoint family.
+
+    Args:
+        url (str): The RDP endpoint URL
+
+    Returns:
+        limiter (TokenBucket): The token bucket
+    """
+    family = endpoint_family(url)
+    bucket = _buckets.get(family)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(family)
+            if bucket is None:
+                bucket = _buckets[family] = TokenBucket(BUDGETS.get(family, BUDGETS['default']))
+    return bucket
+
+def configure(budgets=None, enabled=None):
+    """
+    This method sets the requests per second budgets and resets the shared token buckets.
+
+    Args:
+        budgets (dict): The requests per second budget keyed by endpoint family (optional)
+        enabled (bool): Enable or disable the client-side throttling (optional)
+
+    Returns:
+        None
+    """
+    global ENABLED
+    with _buckets_lock:
+        if budgets:
+            BUDGETS.update(budgets)
+        if enabled is not None:
+            ENABLED = enabled
+        _buckets.clear()
@@ -0,0 +1,219 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import asyncio
+import time
+import httpx
+import json_backend
+import metrics
+import rate_limiter
+import rdp_config
+import retry_policy
+import single_flight
+import requests_session_v1
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
+
+# Default maximum number of in-flight requests and request timeout in seconds, see rdp_config.py
+MAX_CONCURRENCY = rdp_config.get('concurrency')
+TIMEOUT = rdp_config.get('timeout.read')
+
+HISTORICAL_FIELDS = 'BID,ASK,OPEN_PRC,HIGH_1,LOW_1,TRDPRC_1,NUM_MOVES,TRNOVR_UNS'
+
+class AsyncRDPClient:
+    """
+    This class sends HTTP request messages to RDP services concurrently with one shared httpx AsyncClient.
+
+    Args:
+        access_token (str or TokenManager): The access token, or an object with a get_token() method
+        host (str): The RDP host URL
+        max_concurrency (int): Maximum number of in-flight requests
+        timeout (float): The request timeout in seconds
+    """
+
+    def __init__(self, access_token, host=None, max_concurrency=MAX_CONCURRENCY, timeout=TIMEOUT):
+        self.access_token = access_token
+        self.host = host or RDP_HOST
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._single_flight = single_flight.AsyncSingleFlight()
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            timeout=timeout,
+            follow_redirects=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    def _token(self):
+        if hasattr(self.access_token, 'get_token'):
+            return self.access_token.get_token()
+        return self.access_token
+
+    async def _send(self, url, params=None, token=None):
+        async with self._semaphore:
+            limiter = rate_limiter.get_limiter(url) if rate_limiter.ENABLED else None
+            if limiter:
+                await asyncio.sleep(limiter.reserve())
+            trace = metrics.HttpxTrace()
+            start = metrics.begin_request()
+            try:
+                response = await self._client.get(url,
+                                                  params=params,
+                                                  headers={'Authorization': f'Bearer {token or self._token()}'},
+                                                  extensions={'trace': trace})
+            except httpx.HTTPError:
+                if metrics.ENABLED:
+                    metrics.record_httpx_response(url, 'GET', start, trace)
+                raise
+            if metrics.ENABLED:
+                metrics.record_httpx_response(url, 'GET', start, trace, response)
+            if limiter:
+                limiter.update(response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    async def _fetch(self, url, params=None):
+        token = self._token()
+        policy = retry_policy.get_policy()
+        response = await policy.call_async(lambda: self._send(url, params, token), 'GET')
+        if response.status_code == 401 and hasattr(self.access_token, 'invalidate'):
+            # The token was rejected before its scheduled refresh, retry once with the new one
+            await asyncio.to_thread(self.access_token.invalidate, token, True)
+            token = self._token()
+            response = await policy.call_async(lambda: self._send(url, params, token), 'GET')
+        response.raise_for_status()
+        return response
+
+    async def _get(self, url, params=None):
+        if single_flight.ENABLED:
+            # Identical requests already in flight share one response
+            key = single_flight.request_key('GET', url, params, {'Authorization': self._token()})
+            response = await self._single_flight.do(key, lambda: self._fetch(url, params))
+        else:
+            response = await self._fetch(url, params)
+        # Each caller decodes the body, so the callers never share the decoded objects
+        start = time.perf_counter()
+        content = json_backend.loads(response.content)
+        if metrics.ENABLED:
+            metrics.record_parse(url, 'GET', time.perf_counter() - start)
+        return content
+
+    async def get_historical_interday_data(self, universe, interval='P1W', start='2025-01-01', end='2025-02-10', fields=HISTORICAL_FIELDS, count=15):
+        """
+        This method sends a HTTP request message to RDP Historical Pricing Service for getting Interday data.
+
+        Args:
+            universe (str): RIC Code
+            interval (str): The summaries interval (ISO 8601 duration)
+            start (str): The start date in YYYY-MM-DD format
+            end (str): The end date in YYYY-MM-DD format
+            fields (str or list of str): The interested field names
+            count (int): Maximum number of rows
+
+        Returns:
+            interday data (json): The Interday data content
+        """
+        if not isinstance(fields, str):
+            fields = ','.join(fields)
+        payload = {'interval': interval,
+                   'count': count,
+                   'fields': fields,
+                   'start': start,
+                   'end': end}
+        return await self._get(f'{self.host}/data/historical-pricing/v1/views/interday-summaries/{universe}', payload)
+
+    async def get_news_headlines(self, universe, limit=5):
+        """
+        This method sends a HTTP request message to RDP News Service for getting news headlines.
+
+        Args:
+            universe (str): RIC Code
+            limit (int): Maximum number of headlines
+
+        Returns:
+            news headlines (json): The News Headlines content
+        """
+        payload = {'query': f'R:{universe} AND Language:LEN AND Source:RTRS', 'limit': limit}
+        return await self._get(f'{self.host}/data/news/v1/headlines', payload)
+
+    async def get_news_story(self, story_id):
+        """
+        This method sends a HTTP request message to RDP News Service for getting news story.
+
+        Args:
+            story_id (str): Story ID code from news headlines
+
+        Returns:
+            news story (json): The News Story content
+        """
+        return await self._get(f'{self.host}/data/news/v1/stories/{story_id}')
+
+    async def get_esg_standard(self, universe):
+        """
+        This method sends a HTTP request message to RDP ESG Service for getting ESG Standard data.
+
+        Args:
+            universe (str or list of str): RIC Code, or RIC Codes sent as one comma separated universe
+
+        Returns:
+            esg data (json): The ESG scores-standard content
+        """
+        if not isinstance(universe, str):
+            universe = ','.join(universe)
+        return await self._get(f'{self.host}/data/environmental-social-governance/v2/views/scores-standard', {'universe': universe})
+
+    async def fan_out(self, func, keys, *args, **kwargs):
+        """
+        This method calls one of the request methods for each key concurrently (bounded by max_concurrency).
+
+        Args:
+            func (coroutine function): The request method, e.g. client.get_historical_interday_data
+            keys (list of str): The RIC Codes or Story IDs, duplicated keys are requested once
+            *args, **kwargs: The other request method parameters
+
+        Returns:
+            results (dict): The result (or the exception) keyed by each key
+        """
+        keys = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(func(key, *args, **kwargs) for key in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+async def main(access_token, universe):
+    async with AsyncRDPClient(access_token) as client:
+        historical = await client.fan_out(client.get_historical_interday_data, universe)
+        esg = await client.fan_out(client.get_esg_standard, universe)
+        headlines = await client.fan_out(client.get_news_headlines, universe)
+        story_ids = [headline['storyId'] for result in headlines.values() if not isinstance(result, Exception) for headline in result['data']]
+        stories = await client.fan_out(client.get_news_story, story_ids)
+    for name, results in (('Historical', historical), ('ESG', esg), ('Headlines', headlines), ('Story', stories)):
+        failed = [key for key, result in results.items() if isinstance(result, Exception)]
+        print(f'{name}: {len(results) - len(failed)} succeeded, {len(failed)} failed {failed}')
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    universe = ['IBM.N', 'MSFT.O', 'AAPL.O', 'AMZN.O', 'GOOGL.O']
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_session_v1.login_v1(username, password, app_key)
+
+        if access_token:
+            asyncio.run(main(access_token, universe))
+            print('Sending Logout request message to RDP')
+            requests_session_v1.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')
@@ -0,0 +1,162 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import copy
+import threading
+import requests
+from urllib3.util.retry import Retry
+import json_backend
+import metrics
+import rate_limiter
+import rdp_config
+import retry_policy
+import single_flight
+
+# Default connection pool settings, see rdp_config.py
+POOL_CONNECTIONS = rdp_config.get('pool.connections')
+POOL_MAXSIZE = rdp_config.get('pool.maxsize')
+MAX_RETRIES = 0
+KEEP_ALIVE = rdp_config.get('pool.keep-alive')
+# Default (connect, read) timeout in seconds
+TIMEOUT = (rdp_config.get('timeout.connect'), rdp_config.get('timeout.read'))
+
+rdp_config.apply_rate_limits()
+
+_session = None
+_session_lock = threading.Lock()
+
+def create_session(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES, keep_alive=KEEP_ALIVE):
+    """
+    This method creates a requests Session object with a tunable HTTPAdapter connection pool.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache
+        pool_maxsize (int): Maximum number of connections kept open per host
+        max_retries (int): Number of connection-level retries done by the adapter
+        keep_alive (bool): Keep connections open between requests (False sends 'Connection: close')
+
+    Returns:
+        session (requests.Session): The pooled Session object
+    """
+    session = requests.Session()
+    retries = Retry(total=max_retries,
+                    read=False,
+                    status=0,
+                    raise_on_status=False)
+    adapter = metrics.TimedHTTPAdapter(pool_connections=pool_connections,
+                                       pool_maxsize=pool_maxsize,
+                                       max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+def get_session():
+    """
+    This method returns the shared pooled Session object, it creates one with the default settings on the first call.
+
+    Args:
+        None
+
+    Returns:
+        session (requests.Session): The shared Session object
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+def configure(**kwargs):
+    """
+    This method replaces the shared Session object with a new one created from the given pool settings.
+
+    Args:
+        **kwargs: The create_session() parameters (pool_connections, pool_maxsize, max_retries, keep_alive)
+
+    Returns:
+        session (requests.Session): The new shared Session object
+    """
+    global _session
+    new_session = create_session(**kwargs)
+    with _session_lock:
+        old_session, _session = _session, new_session
+    if old_session is not None:
+        old_session.close()
+    return new_session
+
+def close_session():
+    """
+    This method closes the shared Session object and all of its pooled connections.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _session
+    with _session_lock:
+        old_session, _session = _session, None
+    if old_session is not None:
+        old_session.close()
+
+def send_request(method, url, idempotent=None, **kwargs):
+    """
+    This method sends a HTTP request message to RDP through the shared pooled Session object.
+    The request waits for the endpoint family rate limiter, and the transient failures are retried with the shared retry policy.
+    Identical GET requests already in flight (same URL, parameters, headers and options) share one response,
+    each caller gets its own copy of the response and of the decoded JSON body.
+    Every attempt is recorded in the metrics registry (phase durations, payload sizes and status code),
+    and response.json() decodes the body once with the selected json_backend.
+
+    Args:
+        method (str): The HTTP method ('GET', 'POST')
+        url (str): The RDP endpoint URL
+        idempotent (bool): Override the method idempotency for the retry policy (optional)
+        **kwargs: The requests parameters (data, params, headers, verify, allow_redirects, timeout, etc.)
+
+    Returns:
+        response (requests.Response): The HTTP response
+    """
+    kwargs.setdefault('timeout', TIMEOUT)
+
+    def on_decode(seconds):
+        metrics.record_parse(url, method, seconds)
+
+    def send():
+        limiter = rate_limiter.get_limiter(url) if rate_limiter.ENABLED else None
+        if limiter:
+            limiter.acquire()
+        start = metrics.begin_request()
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            if metrics.ENABLED:
+                metrics.record_response(url, method, start)
+            raise
+        if metrics.ENABLED:
+            metrics.record_response(url, method, start, response)
+        json_backend.install(response, on_decode if metrics.ENABLED else None)
+        if limiter:
+            limiter.update(response.status_code, response.headers.get('Retry-After'))
+        return response
+
+    def send_with_retry():
+        return retry_policy.get_policy().call(send, method, idempotent)
+
+    if single_flight.ENABLED and method.upper() == 'GET' and not kwargs.get('stream'):
+        options = {name: value for name, value in kwargs.items() if name not in ('params', 'headers')}
+        key = single_flight.request_key(method, url, kwargs.get('params'), kwargs.get('headers'), **options)
+        response = single_flight.get_group().do(key, send_with_retry)
+        # The callers may change the decoded body, so each one decodes its own copy
+        response = copy.copy(response)
+        json_backend.install(response, on_decode if metrics.ENABLED else None)
+        return response
+    return send_with_retry()
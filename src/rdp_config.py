@@ -0,0 +1,208 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import copy
+import json
+import os
+import threading
+from rdp_logging import find_config
+
+# Used when a setting is neither in the configuration file nor in the environment
+DEFAULTS = {
+    'host': 'https://api.refinitiv.com',
+    'scope': 'trapi',
+    'credentials': {
+        'username': None,
+        'password': None,
+        'app-key': None,
+        'client-id': None,
+        'client-secret': None
+    },
+    'pool': {'connections': 10, 'maxsize': 10, 'keep-alive': True},
+    'timeout': {'connect': 10.0, 'read': 30.0},
+    'concurrency': 20,
+    'rate': {'enabled': True, 'budgets': {}},
+    'cache': {
+        'historical': 'historical_cache.sqlite',
+        'esg-store': 'esg_store.sqlite',
+        'news-dir': 'news_cache'
+    }
+}
+
+# The environment variables (and .env file entries) that override a setting
+ENV_VARIABLES = {
+    'host': 'RDP_HOST',
+    'scope': 'RDP_SCOPE',
+    'credentials.username': 'MACHINE_ID',
+    'credentials.password': 'PASSWORD',
+    'credentials.app-key': 'APP_KEY',
+    'credentials.client-id': 'CLIENT_ID',
+    'credentials.client-secret': 'CLIENT_SECRET',
+    'pool.connections': 'RDP_POOL_CONNECTIONS',
+    'pool.maxsize': 'RDP_POOL_MAXSIZE',
+    'pool.keep-alive': 'RDP_KEEP_ALIVE',
+    'timeout.connect': 'RDP_CONNECT_TIMEOUT',
+    'timeout.read': 'RDP_READ_TIMEOUT',
+    'concurrency': 'RDP_MAX_CONCURRENCY',
+    'rate.enabled': 'RDP_RATE_LIMIT',
+    'cache.historical': 'RDP_HISTORICAL_CACHE',
+    'cache.esg-store': 'RDP_ESG_STORE',
+    'cache.news-dir': 'RDP_NEWS_CACHE_DIR'
+}
+# RDP_RATE_<FAMILY> (e.g. RDP_RATE_HISTORICAL_PRICING=5) overrides the requests per second budget of an endpoint family
+RATE_ENV_PREFIX = 'RDP_RATE_'
+
+# The Data Library session keys of the credentials
+SESSION_CREDENTIALS = {
+    'username': 'username',
+    'password': 'password',
+    'app-key': 'app-key',
+    'client-id': 'client_id',
+    'client-secret': 'client_secret'
+}
+
+_settings = None
+_explicit = set()
+_load_lock = threading.Lock()
+
+def _merge(target, source, prefix=''):
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict) and key != 'budgets':
+            _merge(target[key], value, f'{prefix}{key}.')
+        else:
+            target[key] = value
+            _explicit.add(f'{prefix}{key}')
+
+def _convert(value, default):
+    if isinstance(default, bool):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(default, int):
+        return int(value)
+    if isinstance(default, float):
+        return float(value)
+    return value
+
+def _lookup(settings, key):
+    value = settings
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+def load(path=None):
+    """
+    This method reads the settings in order of precedence: the environment variables (and the .env file),
+    the 'rdp' section and the default session of the Data Library configuration file, then DEFAULTS.
+
+    Args:
+        path (str): The Data Library configuration file path (optional, see rdp_logging.find_config())
+
+    Returns:
+        settings (dict): The settings
+    """
+    global _settings
+    from dotenv import load_dotenv
+    load_dotenv()  # take environment variables from .env.
+    settings = copy.deepcopy(DEFAULTS)
+    _explicit.clear()
+
+    config_path = find_config(path)
+    if config_path is not None:
+        with open(config_path) as config_file:
+            config = json.load(config_file)
+        # The credentials and host of the Data Library default session, e.g. sessions.platform.ldp
+        session = _lookup(config.get('sessions', {}), config.get('sessions', {}).get('default', '')) or {}
+        if session.get('base-url'):
+            _merge(settings, {'host': session['base-url']})
+        _merge(settings, {'credentials': {name: session[key] for name, key in SESSION_CREDENTIALS.items() if session.get(key)}})
+        # The Data Library ignores the sections it does not know
+        _merge(settings, config.get('rdp', {}))
+
+    for key, variable in ENV_VARIABLES.items():
+        if os.environ.get(variable):
+            section, _, name = key.rpartition('.')
+            target = _lookup(settings, section) if section else settings
+            target[name] = _convert(os.environ[variable], _lookup(DEFAULTS, key))
+            _explicit.add(key)
+    for variable, value in os.environ.items():
+        if variable.startswith(RATE_ENV_PREFIX) and variable != ENV_VARIABLES['rate.enabled'] and value:
+            settings['rate']['budgets'][variable[len(RATE_ENV_PREFIX):].lower().replace('_', '-')] = float(value)
+            _explicit.add('rate.budgets')
+
+    _settings = settings
+    return settings
+
+def get(key, default=None):
+    """
+    This method returns a setting, the settings are loaded on the first call.
+
+    Args:
+        key (str): The setting name, with dots between the sections, e.g. 'pool.maxsize'
+        default: Returned when the setting is not set (optional)
+
+    Returns:
+        value: The setting value
+    """
+    if _settings is None:
+        with _load_lock:
+            if _settings is None:
+                load()
+    value = _lookup(_settings, key)
+    return default if value is None else value
+
+def is_set(key):
+    """
+    This method returns if a setting comes from the configuration file or from the environment, not from DEFAULTS.
+
+    Args:
+        key (str): The setting name
+
+    Returns:
+        result (bool): True if the setting is set
+    """
+    get(key)
+    return key in _explicit
+
+def apply_rate_limits():
+    """
+    This method sets the rate limiter budgets and enabled flag that come from the configuration file or from the environment.
+    rdp_client calls it when it is imported, so the rate_limiter.configure() calls done in code afterwards take precedence.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    import rate_limiter
+    if is_set('rate.budgets') or is_set('rate.enabled'):
+        rate_limiter.configure(budgets=get('rate.budgets') if is_set('rate.budgets') else None,
+                               enabled=get('rate.enabled') if is_set('rate.enabled') else None)
+
+def configure_ld():
+    """
+    This method sets the Data Library default session host, credentials and request timeout that come from
+    the environment or from the 'rdp' section, call it before ld.open_session().
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    import lseg.data as ld
+    config = ld.get_config()
+    session = f'sessions.{config.get_param("sessions.default")}'
+    if is_set('host'):
+        config.set_param(f'{session}.base-url', get('host'), auto_create=True)
+    for name, key in SESSION_CREDENTIALS.items():
+        # Only the credentials of the session grant type, e.g. no client_id in a platform.ldp (V1) session
+        if os.environ.get(ENV_VARIABLES[f'credentials.{name}']) and config.get_param(f'{session}.{key}') is not None:
+            config.set_param(f'{session}.{key}', get(f'credentials.{name}'), auto_create=True)
+    if is_set('timeout.read'):
+        config.set_param('http.request-timeout', get('timeout.read'))
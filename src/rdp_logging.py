@@ -0,0 +1,217 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+import rate_limiter
+
+CONFIG_NAME = 'lseg-data.config.json'
+
+# Used when no Data Library configuration file is found
+DEFAULT_LOGS = {
+    'level': 'info',
+    'transports': {
+        'console': {'enabled': True},
+        'file': {'enabled': False, 'name': 'rdp-requests.log'}
+    }
+}
+# Maximum number of payload characters written per log message
+PAYLOAD_LIMIT = 2000
+# Level of the console handler added when every transport is disabled, so the errors are still shown
+CONSOLE_LEVEL = logging.WARNING
+
+_listener = None
+_settings = {'sampling': {}, 'payload_limit': PAYLOAD_LIMIT}
+_setup_lock = threading.Lock()
+
+class JsonFormatter(logging.Formatter):
+    """
+    This class formats the log records as JSON lines, with the RDP request fields (family, status, url) when they are set.
+    """
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for name in ('family', 'status', 'url'):
+            if hasattr(record, name):
+                entry[name] = getattr(record, name)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+def find_config(path=None):
+    """
+    This method returns the Data Library configuration file path, in the same order as the library:
+    the given path, the LD_LIB_CONFIG_PATH directory, then the current directory.
+
+    Args:
+        path (str): The configuration file path (optional)
+
+    Returns:
+        path (str): The configuration file path, None if there is no file
+    """
+    candidates = [path] if path else []
+    if os.environ.get('LD_LIB_CONFIG_PATH'):
+        candidates.append(os.path.join(os.environ['LD_LIB_CONFIG_PATH'], CONFIG_NAME))
+    candidates.append(CONFIG_NAME)
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+def load_logs_config(path=None):
+    """
+    This method reads the 'logs' section of the Data Library configuration file.
+    Besides the library settings (level, transports), it may hold 'format' ('text' or 'json'),
+    'sampling' (the ratio of payload messages kept, keyed by endpoint family) and 'payload-limit'.
+
+    Args:
+        path (str): The configuration file path (optional)
+
+    Returns:
+        logs (dict): The logs settings
+    """
+    config_path = find_config(path)
+    if config_path is None:
+        return DEFAULT_LOGS
+    with open(config_path) as config_file:
+        return json.load(config_file).get('logs', DEFAULT_LOGS)
+
+def setup_logging(path=None, console_level=None):
+    """
+    This method configures the 'rdp' loggers from the configuration file. The records go through a queue to a
+    background thread that formats and writes them, so logging does not block the request threads.
+    When every transport is disabled, the records of CONSOLE_LEVEL and above are still written on the console.
+
+    Args:
+        path (str): The configuration file path (optional)
+        console_level (int): Write the records of this level and above on the console, whatever the transports (optional)
+
+    Returns:
+        logger (logging.Logger): The 'rdp' logger
+    """
+    global _listener
+    logs = load_logs_config(path)
+    transports = logs.get('transports', {})
+    formatter = JsonFormatter() if logs.get('format') == 'json' else logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    level = logging.getLevelName(str(logs.get('level', 'info')).upper())
+
+    handlers = []
+    if transports.get('console', {}).get('enabled'):
+        handlers.append(logging.StreamHandler())
+    if transports.get('file', {}).get('enabled'):
+        handlers.append(logging.FileHandler(transports['file'].get('name', DEFAULT_LOGS['transports']['file']['name'])))
+    if console_level is not None or not handlers:
+        if not transports.get('console', {}).get('enabled'):
+            console = logging.StreamHandler()
+            console.setLevel(console_level if console_level is not None else CONSOLE_LEVEL)
+            handlers.append(console)
+        if console_level is not None:
+            level = min(level, console_level)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    logger = logging.getLogger('rdp')
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+        _settings['sampling'] = logs.get('sampling', {})
+        _settings['payload_limit'] = int(logs.get('payload-limit', PAYLOAD_LIMIT))
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    return logger
+
+def shutdown():
+    """
+    This method writes the queued records and stops the background thread.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+atexit.register(shutdown)
+
+def get_logger(name):
+    """
+    This method returns a child logger of 'rdp', the logging is set up from the configuration file on the first call.
+
+    Args:
+        name (str): The logger name, e.g. 'historical'
+
+    Returns:
+        logger (logging.Logger): The 'rdp.<name>' logger
+    """
+    root = logging.getLogger('rdp')
+    if not root.handlers:
+        setup_logging()
+    return root.getChild(name)
+
+def payload_preview(response, limit=None):
+    """
+    This method returns the beginning of a response body, without decoding the whole body.
+
+    Args:
+        response (requests.Response): The HTTP response
+        limit (int): Maximum number of characters (defaults to the 'payload-limit' setting)
+
+    Returns:
+        preview (str): The truncated body
+    """
+    limit = limit or _settings['payload_limit']
+    content = response.content or b''
+    preview = content[:limit].decode(response.encoding or 'utf-8', errors='replace')
+    if len(content) > limit:
+        preview += f'... ({len(content)} bytes)'
+    return preview
+
+def log_payload(logger, message, response, level=logging.DEBUG):
+    """
+    This method logs a message with the truncated response body. The payload messages of each endpoint family
+    are sampled with the 'sampling' setting, the body is not read at all when the message is dropped.
+
+    Args:
+        logger (logging.Logger): The logger
+        message (str): The message
+        response (requests.Response): The HTTP response
+        level (int): The log level
+
+    Returns:
+        None
+    """
+    if not logger.isEnabledFor(level):
+        return
+    family = rate_limiter.endpoint_family(response.url)
+    rate = _settings['sampling'].get(family, _settings['sampling'].get('default', 1))
+    if level < logging.WARNING and rate < 1 and random.random() >= rate:
+        return
+    logger.log(level, '%s: %s', message, payload_preview(response),
+               extra={'family': family, 'status': response.status_code, 'url': response.url})
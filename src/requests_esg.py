@@ -5,16 +5,25 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import os
 import json
+import logging
 import requests
 import base64
 import time
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import rdp_client
+import rdp_config
+import rdp_logging
 
-scope = 'trapi'
+scope = rdp_config.get('scope')
 
-RDP_HOST = 'https://api.refinitiv.com'
+log = rdp_logging.get_logger('esg')
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
+
+# Maximum number of RICs per scores-standard request
+ESG_BATCH_SIZE = 100
 
 access_token = None
 refresh_token = None
@@ -45,21 +54,22 @@ def login_v1(username, password, app_key):
     payload=f'username={username}&password={password}&grant_type=password&scope={scope}&takeExclusiveSignOnControl=true&client_id={app_key}'
 
     try:
-       response = requests.post(auth_url, 
+       response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication exception: {e}')
+        log.error('RDP Authentication exception: %s', e)
         return None, None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'], response.json()['refresh_token'], int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], content['refresh_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
 def logout(app_key, access_token):
@@ -84,7 +94,7 @@ def logout(app_key, access_token):
     payload = f'token={access_token}'
 
     try:
-        response = requests.post(auth_url,
+        response = rdp_client.send_request('POST', auth_url,
                                  data = payload,
                                  headers= {
                                      'Content-Type':'application/x-www-form-urlencoded',
@@ -92,56 +102,151 @@ def logout(app_key, access_token):
                                  },
                                  auth=(app_key, ''))
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication Revoke exception: {e}')
+        log.error('RDP Authentication Revoke exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Revoke Token success')
+        log.info('Revoke Token success')
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
-def get_esg_standard(universe, access_token):
+def send_esg_standard_request(universe, access_token):
     """
-    This method sends a HTTP request message to RDP Historical Pricing Service for getting ESG Standard data and print it on a console.
+    This method sends a HTTP request message to RDP ESG Service for getting ESG Standard data.
 
     Args:
-        universe (str): RIC Code
+        universe (str or list of str): RIC Code, or RIC Codes sent as one comma separated universe
         access_token (str): The access token
 
-    Returns: 
-        None
+    Returns:
+        response (requests.Response): The HTTP response
     """
     global RDP_HOST
 
+    if not isinstance(universe, str):
+        universe = ','.join(universe)
+
     # https://{{RDP_HOST}}/data/environmental-social-governance/{{RDP_VERSION_ESG}}/views/scores-standard?universe={{SYMBOL}}
     esg_url = f'{RDP_HOST}/data/environmental-social-governance/v2/views/scores-standard'
     payload = {'universe': universe}
 
+    return rdp_client.send_request('GET', url= esg_url,
+                                   headers= {
+                                       'Authorization': f'Bearer {access_token}'
+                                   },
+                                   params= payload,
+                                   verify=True,
+                                   allow_redirects=False)
+
+def get_esg_standard(universe, access_token):
+    """
+    This method sends a HTTP request message to RDP ESG Service for getting ESG Standard data and print it on a console.
+
+    Args:
+        universe (str or list of str): RIC Code(s)
+        access_token (str): The access token
+
+    Returns: 
+        esg data (json): The ESG scores-standard content
+    """
     # Send HTTP request
     try:
-        response = requests.get(url= esg_url,
-                                headers= {
-                                    'Authorization': f'Bearer {access_token}'
-                                }, 
-                                params= payload,
-                                verify=True,
-                                 allow_redirects=False)
+        response = send_esg_standard_request(universe, access_token)
     except requests.exceptions.RequestException as e:
-        print(f'RDP ESG request exception: {e}')
+        log.error('RDP ESG request exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('This is an ESG data result from RDP API Call')
-        print(response.json())
+        rdp_logging.log_payload(log, 'This is an ESG data result from RDP API Call', response, logging.INFO)
+        return response.json()
     if response.status_code != 200:
-        print(f'RDP ESG request  failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP ESG request  failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
+
+def chunk_universe(universe, batch_size=ESG_BATCH_SIZE):
+    """
+    This method splits a universe into batches, the duplicated RICs are removed.
+
+    Args:
+        universe (list of str): RIC Codes
+        batch_size (int): Maximum number of RICs per batch
+
+    Returns:
+        batches (list of list of str): The RIC Codes of each batch
+    """
+    universe = list(dict.fromkeys(universe))
+    return [universe[index:index + batch_size] for index in range(0, len(universe), batch_size)]
+
+def merge_esg_tables(contents, universe):
+    """
+    This method merges the scores-standard responses of each batch into one table keyed by instrument and period.
+
+    Args:
+        contents (list of dict): The ESG scores-standard response messages
+        universe (list of str): The requested RIC Codes, the merged rows follow their order
+
+    Returns:
+        merged (dict): The ESG scores-standard response message with the rows of all batches
+    """
+    contents = [content for content in contents if content and content.get('headers')]
+    if not contents:
+        return {'headers': [], 'data': []}
+    headers = contents[0]['headers']
+    names = [header['name'].lower() for header in headers]
+    instrument_index = names.index('instrument') if 'instrument' in names else 0
+    period_index = names.index('periodenddate') if 'periodenddate' in names else 1
+
+    rows = {}
+    for content in contents:
+        for row in content.get('data') or []:
+            rows[(row[instrument_index], row[period_index])] = row
+    order = {ric: position for position, ric in enumerate(dict.fromkeys(universe))}
+    # Instruments in the requested order, latest period first
+    keys = sorted(rows, key=lambda key: key[1] or '', reverse=True)
+    keys.sort(key=lambda key: order.get(key[0], len(order)))
+    return {'links': {'count': len(keys)}, 'headers': headers, 'data': [rows[key] for key in keys]}
+
+def get_esg_standard_batch(universe, access_token, batch_size=ESG_BATCH_SIZE, max_workers=rdp_client.POOL_MAXSIZE):
+    """
+    This method sends the ESG Standard requests of a large universe in comma separated batches concurrently
+    and merges the results into one table.
+
+    Args:
+        universe (list of str): RIC Codes
+        access_token (str): The access token
+        batch_size (int): Maximum number of RICs per request
+        max_workers (int): Maximum number of concurrent requests, keep it within the rdp_client pool size
+
+    Returns:
+        esg data (dict): The merged ESG scores-standard content keyed by instrument and period
+        errors (dict): The exception keyed by RIC for the RICs of the failed batches
+    """
+    def fetch(batch):
+        response = send_esg_standard_request(batch, access_token)
+        response.raise_for_status()
+        return response.json()
+
+    contents = []
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, batch): batch for batch in chunk_universe(universe, batch_size)}
+        for future in as_completed(futures):
+            try:
+                contents.append(future.result())
+            except Exception as exp:
+                errors.update(dict.fromkeys(futures[future], exp))
+    merged = merge_esg_tables(contents, universe)
+    log.info('ESG batch result: %s rows, %s RICs failed', len(merged['data']), len(errors))
+    return merged, errors
 
 
 if __name__ == '__main__':
-    load_dotenv()  # take environment variables from .env.
-    username = os.environ['MACHINE_ID'] 
-    password = os.environ['PASSWORD'] 
-    app_key = os.environ['APP_KEY'] 
+    # Show the RDP responses on the console, even when the configuration file disables the transports
+    rdp_logging.setup_logging(console_level=logging.INFO)
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
 
     universe = 'IBM.N'
 
@@ -5,21 +5,29 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import os
 import json
+import logging
 import requests
 import base64
 import time
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import rdp_client
+import rdp_config
+import rdp_logging
 
-scope = 'trapi'
+scope = rdp_config.get('scope')
 
-RDP_HOST = 'https://api.refinitiv.com'
+log = rdp_logging.get_logger('historical')
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
 
 access_token = None
 refresh_token = None
 expires_in = 0
 
+HISTORICAL_FIELDS = 'BID,ASK,OPEN_PRC,HIGH_1,LOW_1,TRDPRC_1,NUM_MOVES,TRNOVR_UNS'
+
 def login_v1(username, password, app_key):
     """
     This method sends a HTTP login request message to RDP Authentication Service V1.
@@ -45,21 +53,22 @@ def login_v1(username, password, app_key):
     payload=f'username={username}&password={password}&grant_type=password&scope={scope}&takeExclusiveSignOnControl=true&client_id={app_key}'
 
     try:
-       response = requests.post(auth_url, 
+       response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication exception: {e}')
+        log.error('RDP Authentication exception: %s', e)
         return None, None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'], response.json()['refresh_token'], int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], content['refresh_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
 def logout(app_key, access_token):
@@ -84,7 +93,7 @@ def logout(app_key, access_token):
     payload = f'token={access_token}'
 
     try:
-        response = requests.post(auth_url,
+        response = rdp_client.send_request('POST', auth_url,
                                  data = payload,
                                  headers= {
                                      'Content-Type':'application/x-www-form-urlencoded',
@@ -92,63 +101,163 @@ def logout(app_key, access_token):
                                  },
                                  auth=(app_key, ''))
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication Revoke exception: {e}')
+        log.error('RDP Authentication Revoke exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Revoke Token success')
+        log.info('Revoke Token success')
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
-def get_historical_interday_data(universe, access_token):
+def send_historical_interday_request(universe, access_token, interval='P1W', start_day='2025-01-01', end_day='2025-02-10', fields=HISTORICAL_FIELDS, count=15):
     """
-    This method sends a HTTP request message to RDP Historical Pricing Service for getting Interday data and print it on a console.
+    This method sends a HTTP request message to RDP Historical Pricing Service for getting Interday data.
 
     Args:
         universe (str): RIC Code
         access_token (str): The access token
+        interval (str): The summaries interval (ISO 8601 duration, 'P1W' is weekly)
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        fields (str or list of str): The interested field names
+        count (int): Maximum number of rows
 
     Returns: 
-        None
+        response (requests.Response): The HTTP response
     """
     global RDP_HOST
-    interval = 'P1W' #weekly
-    start_day = '2025-01-01'
-    end_day = '2025-02-10'
+
+    if not isinstance(fields, str):
+        fields = ','.join(fields)
 
     # https://api.refinitiv.com/data/historical-pricing/v1/views/interday-summaries/{{universe}}
     historical_pricing_url = f'{RDP_HOST}/data/historical-pricing/v1/views/interday-summaries/{universe}'
 
     payload = {'interval': interval, 
-               'count':15,
-               'fields':'BID,ASK,OPEN_PRC,HIGH_1,LOW_1,TRDPRC_1,NUM_MOVES,TRNOVR_UNS',
+               'count':count,
+               'fields':fields,
                'start':start_day,
                'end':end_day}
     # Send HTTP request
+    return rdp_client.send_request('GET', url= historical_pricing_url,
+                                   headers= {
+                                       'Authorization': f'Bearer {access_token}'
+                                   }, 
+                                   params= payload,
+                                   verify=True,
+                                   allow_redirects=False)
+
+def send_historical_events_request(universe, access_token, event_types='trade,correction', start=None, end=None, count=None, stream=False):
+    """
+    This method sends a HTTP request message to RDP Historical Pricing Service for getting Events data.
+
+    Args:
+        universe (str): RIC Code
+        access_token (str): The access token
+        event_types (str): The event types separated by comma
+        start (str): The start timestamp in ISO 8601 format (optional)
+        end (str): The end timestamp in ISO 8601 format (optional)
+        count (int): Maximum number of rows (optional)
+        stream (bool): Do not read the response body now, see historical_stream.py
+
+    Returns: 
+        response (requests.Response): The HTTP response
+    """
+    global RDP_HOST
+
+    # https://api.refinitiv.com/data/historical-pricing/v1/views/events/{{universe}}
+    historical_pricing_url = f'{RDP_HOST}/data/historical-pricing/v1/views/events/{universe}'
+
+    payload = {'eventTypes': event_types,
+               'adjustments': 'exchangeCorrection,manualCorrection'}
+    for name, value in (('start', start), ('end', end), ('count', count)):
+        if value is not None:
+            payload[name] = value
+    # Send HTTP request
+    return rdp_client.send_request('GET', url= historical_pricing_url,
+                                   headers= {
+                                       'Authorization': f'Bearer {access_token}'
+                                   }, 
+                                   params= payload,
+                                   verify=True,
+                                   allow_redirects=False,
+                                   stream=stream)
+
+def get_historical_interday_data(universe, access_token, interval='P1W', start_day='2025-01-01', end_day='2025-02-10', fields=HISTORICAL_FIELDS, count=15):
+    """
+    This method sends a HTTP request message to RDP Historical Pricing Service for getting Interday data and print it on a console.
+
+    Args:
+        universe (str): RIC Code
+        access_token (str): The access token
+        interval (str): The summaries interval (ISO 8601 duration, 'P1W' is weekly)
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        fields (str or list of str): The interested field names
+        count (int): Maximum number of rows
+
+    Returns: 
+        interday data (json): The Interday data content
+    """
     try:
-        response = requests.get(url= historical_pricing_url,
-                                headers= {
-                                    'Authorization': f'Bearer {access_token}'
-                                }, 
-                                params= payload,
-                                verify=True,
-                                 allow_redirects=False)
+        response = send_historical_interday_request(universe, access_token, interval, start_day, end_day, fields, count)
     except requests.exceptions.RequestException as e:
-        print(f'RDP historical-pricing request exception: {e}')
+        log.error('RDP historical-pricing request exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('This is a Historical Pricing Inter-Day data result from RDP API Call')
-        print(response.json())
+        rdp_logging.log_payload(log, 'This is a Historical Pricing Inter-Day data result from RDP API Call', response, logging.INFO)
+        return response.json()
     if response.status_code != 200:
-        print(f'RDP historical-pricing Inter-Day request failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP historical-pricing Inter-Day request failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
+def get_historical_interday_batch(universes, access_token, interval='P1W', start_day='2025-01-01', end_day='2025-02-10', fields=HISTORICAL_FIELDS, count=15, max_workers=rdp_client.POOL_MAXSIZE, cache=None):
+    """
+    This method sends HTTP request messages to RDP Historical Pricing Service for getting Interday data of multiple RICs concurrently.
+
+    Args:
+        universes (list of str): RIC Codes
+        access_token (str): The access token
+        interval (str): The summaries interval (ISO 8601 duration, 'P1W' is weekly)
+        start_day (str): The start date in YYYY-MM-DD format
+        end_day (str): The end date in YYYY-MM-DD format
+        fields (str or list of str): The interested field names
+        count (int): Maximum number of rows
+        max_workers (int): Maximum number of concurrent requests, keep it within the rdp_client pool size
+        cache (HistoricalCache): The historical_cache.HistoricalCache object to read from and store to (optional)
+
+    Returns: 
+        results (dict): The Interday data content keyed by RIC
+        errors (dict): The exception keyed by RIC for the failed requests
+    """
+    def fetch(universe):
+        if cache is not None:
+            return cache.get_historical_interday_data(universe, access_token, interval, start_day, end_day, fields, count)
+        response = send_historical_interday_request(universe, access_token, interval, start_day, end_day, fields, count)
+        response.raise_for_status()
+        return response.json()
+
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, universe): universe for universe in dict.fromkeys(universes)}
+        for future in as_completed(futures):
+            universe = futures[future]
+            try:
+                results[universe] = future.result()
+            except Exception as exp:
+                errors[universe] = exp
+    log.info('Historical Pricing Inter-Day batch result: %s succeeded, %s failed', len(results), len(errors))
+    return results, errors
 
 if __name__ == '__main__':
-    load_dotenv()  # take environment variables from .env.
-    username = os.environ['MACHINE_ID'] 
-    password = os.environ['PASSWORD'] 
-    app_key = os.environ['APP_KEY'] 
+    # Show the RDP responses on the console, even when the configuration file disables the transports
+    rdp_logging.setup_logging(console_level=logging.INFO)
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
 
     universe = 'IBM.N'
 
@@ -164,6 +273,9 @@ if __name__ == '__main__':
             # code to request data
             
             get_historical_interday_data(universe, access_token)
+
+            print()
+            results, errors = get_historical_interday_batch(['IBM.N', 'MSFT.O', 'AAPL.O', 'AMZN.O'], access_token)
             
             time.sleep(20)
             print('Sending Logout request message to RDP')
@@ -5,16 +5,22 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import os
 import json
+import logging
 import requests
 import base64
 import time
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+import rdp_client
+import rdp_config
+import rdp_logging
 
-scope = 'trapi'
+scope = rdp_config.get('scope')
 
-RDP_HOST = 'https://api.refinitiv.com'
+log = rdp_logging.get_logger('news')
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
 
 access_token = None
 refresh_token = None
@@ -45,21 +51,22 @@ def login_v1(username, password, app_key):
     payload=f'username={username}&password={password}&grant_type=password&scope={scope}&takeExclusiveSignOnControl=true&client_id={app_key}'
 
     try:
-       response = requests.post(auth_url, 
+       response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication exception: {e}')
+        log.error('RDP Authentication exception: %s', e)
         return None, None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'], response.json()['refresh_token'], int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], content['refresh_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
 def logout(app_key, access_token):
@@ -84,7 +91,7 @@ def logout(app_key, access_token):
     payload = f'token={access_token}'
 
     try:
-        response = requests.post(auth_url,
+        response = rdp_client.send_request('POST', auth_url,
                                  data = payload,
                                  headers= {
                                      'Content-Type':'application/x-www-form-urlencoded',
@@ -92,13 +99,107 @@ def logout(app_key, access_token):
                                  },
                                  auth=(app_key, ''))
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication Revoke exception: {e}')
+        log.error('RDP Authentication Revoke exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Revoke Token success')
+        log.info('Revoke Token success')
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
+
+def send_news_headlines_request(query, access_token, limit=5, cursor=None):
+    """
+    This method sends a HTTP request message to RDP News Service for getting one page of news headlines.
+
+    Args:
+        query (str): The news query
+        access_token (str): The access token
+        limit (int): Maximum number of headlines in the page
+        cursor (str): The page cursor from the previous page meta.next value (optional)
+
+    Returns: 
+        response (requests.Response): The HTTP response
+    """
+    global RDP_HOST
+
+    # https://api.refinitiv.com/data/news/v1/headlines?query={{query}}
+    headlines_url = f'{RDP_HOST}/data/news/v1/headlines'
+    payload = {'query': query,'limit':limit}
+    if cursor:
+        payload['cursor'] = cursor
+
+    # Send HTTP request
+    return rdp_client.send_request('GET', url= headlines_url,
+                                   headers= {
+                                       'Authorization': f'Bearer {access_token}'
+                                   }, 
+                                   params= payload,
+                                   verify=True,
+                                   allow_redirects=False)
+
+def send_news_story_request(story_id, access_token):
+    """
+    This method sends a HTTP request message to RDP News Service for getting news story.
+
+    Args:
+        story_id (str): Story ID code from news headlines
+        access_token (str): The access token
+
+    Returns: 
+        response (requests.Response): The HTTP response
+    """
+    global RDP_HOST
+
+    # https://api.refinitiv.com/data/news/v1/stories/{{story_id}}
+    story_url = f'{RDP_HOST}/data/news/v1/stories/{story_id}'
+
+    # Send HTTP request
+    return rdp_client.send_request('GET', url= story_url,
+                                   headers= {
+                                       'Authorization': f'Bearer {access_token}'
+                                   }, 
+                                   verify=True,
+                                   allow_redirects=False)
+
+def iter_news_headlines(query, access_token, limit=100, max_headlines=None):
+    """
+    This method iterates over all news headlines of a query page by page with the meta.next cursor.
+    The next page is requested in the background while the caller processes the current page,
+    and at most two pages are held in memory.
+
+    Args:
+        query (str): The news query
+        access_token (str): The access token
+        limit (int): Headlines per page
+        max_headlines (int): Stop after this many headlines (optional)
+
+    Returns: 
+        headlines (generator): The news headlines one by one
+    """
+    def fetch(cursor):
+        response = send_news_headlines_request(query, access_token, limit=limit, cursor=cursor)
+        response.raise_for_status()
+        return response.json()
+
+    received = 0
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='news-headlines')
+    try:
+        future = executor.submit(fetch, None)
+        while future is not None:
+            content = future.result()
+            headlines = content.get('data', [])
+            cursor = content.get('meta', {}).get('next')
+            remaining = None if max_headlines is None else max_headlines - received - len(headlines)
+            # Prefetch the next page before giving back this one
+            future = executor.submit(fetch, cursor) if cursor and headlines and (remaining is None or remaining > 0) else None
+            for headline in headlines:
+                if max_headlines is not None and received >= max_headlines:
+                    return
+                received += 1
+                yield headline
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 def get_news_headlines(universe, access_token):
     """
@@ -111,72 +212,56 @@ def get_news_headlines(universe, access_token):
     Returns: 
         news headlines (json): The News Headlines content
     """
-    global RDP_HOST
+    query = f'R:{universe} AND Language:LEN AND Source:RTRS'
 
-    # https://api.refinitiv.com/data/news/v1/headlines?query={{query}}
-    headlines_url = f'{RDP_HOST}/data/news/v1/headlines'
-    payload = {'query': f'R:{universe} AND Language:LEN AND Source:RTRS','limit':5}
-    
     # Send HTTP request
     try:
-        response = requests.get(url= headlines_url,
-                                headers= {
-                                    'Authorization': f'Bearer {access_token}'
-                                }, 
-                                params= payload,
-                                verify=True,
-                                 allow_redirects=False)
+        response = send_news_headlines_request(query, access_token, limit=5)
     except requests.exceptions.RequestException as e:
-        print(f'RDP ESG request exception: {e}')
+        log.error('RDP News request exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('This is an News headlines result from RDP API Call')
-        print(response.json())
+        rdp_logging.log_payload(log, 'This is an News headlines result from RDP API Call', response, logging.INFO)
         return response.json()
     if response.status_code != 200:
-        print(f'RDP News request  failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP News request  failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
-def get_news_story(story_id, access_token):
+def get_news_story(story_id, access_token, cache=None):
     """
     This method sends a HTTP request message to RDP News Service for getting news story and print it on a console.
 
     Args:
         story_id (str): Story ID code from news headlines
         access_token (str): The access token
+        cache (NewsStoryCache): The news_cache.NewsStoryCache object, the story is requested only if it is not cached (optional)
 
     Returns: 
-        None
+        news story (json): The News Story content
     """
-    global RDP_HOST
-
-    # https://api.refinitiv.com/data/news/v1/stories/{{story_id}}
-    story_url = f'{RDP_HOST}/data/news/v1/stories/{story_id}'
-
+    if cache is not None:
+        return cache.get_or_fetch(story_id, lambda: get_news_story(story_id, access_token))
     # Send HTTP request
     try:
-        response = requests.get(url= story_url,
-                                headers= {
-                                    'Authorization': f'Bearer {access_token}'
-                                }, 
-                                verify=True,
-                                 allow_redirects=False)
+        response = send_news_story_request(story_id, access_token)
     except requests.exceptions.RequestException as e:
-        print(f'RDP ESG request exception: {e}')
+        log.error('RDP News request exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print(f'This is an News story result from RDP API Call for {story_id}')
-        print(response.json())
+        rdp_logging.log_payload(log, f'This is an News story result from RDP API Call for {story_id}', response, logging.INFO)
+        return response.json()
     if response.status_code != 200:
-        print(f'RDP News request  failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
-
+        log.error('RDP News request  failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
 if __name__ == '__main__':
-    load_dotenv()  # take environment variables from .env.
-    username = os.environ['MACHINE_ID'] 
-    password = os.environ['PASSWORD'] 
-    app_key = os.environ['APP_KEY'] 
+    # Show the RDP responses on the console, even when the configuration file disables the transports
+    rdp_logging.setup_logging(console_level=logging.INFO)
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
 
     universe = 'IBM.N'
 
@@ -5,17 +5,22 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import os
 import json
+import logging
 import requests
 import base64
 import time
-from dotenv import load_dotenv
+import rdp_client
+import rdp_config
+import rdp_logging
 
 
-scope = 'trapi'
+scope = rdp_config.get('scope')
 
-RDP_HOST = 'https://api.refinitiv.com'
+log = rdp_logging.get_logger('auth')
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
 
 access_token = None
 refresh_token = None
@@ -46,21 +51,22 @@ def login_v1(username, password, app_key):
 
     # Send HTTP request
     try:
-       response = requests.post(auth_url, 
+       response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication exception: {e}')
+        log.error('RDP Authentication exception: %s', e)
         return None, None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'], response.json()['refresh_token'], int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], content['refresh_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
 def refresh_login_v1(refresh_token, app_key):
@@ -87,21 +93,22 @@ def refresh_login_v1(refresh_token, app_key):
 
     # Send HTTP request
     try:
-       response = requests.post(auth_url, 
+       response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication Refresh Token exception: {e}')
+        log.error('RDP Authentication Refresh Token exception: %s', e)
         return None, None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'], response.json()['refresh_token'], int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], content['refresh_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication Refresh Token failure: {response.status_code} - {response.text} ', response = response )
 
     
@@ -128,7 +135,7 @@ def logout(app_key, access_token):
 
     # Send HTTP request
     try:
-        response = requests.post(auth_url,
+        response = rdp_client.send_request('POST', auth_url,
                                  data = payload,
                                  headers= {
                                      'Content-Type':'application/x-www-form-urlencoded',
@@ -136,20 +143,22 @@ def logout(app_key, access_token):
                                  },
                                  auth=(app_key, ''))
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication Revoke exception: {e}')
+        log.error('RDP Authentication Revoke exception: %s', e)
+        return
 
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Revoke Token success')
+        log.info('Revoke Token success')
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
 
 
 if __name__ == '__main__':
-    load_dotenv()  # take environment variables from .env.
-    username = os.environ['MACHINE_ID'] 
-    password = os.environ['PASSWORD'] 
-    app_key = os.environ['APP_KEY'] 
+    # Show the RDP responses on the console, even when the configuration file disables the transports
+    rdp_logging.setup_logging(console_level=logging.INFO)
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
 
     try:
         print('Sending initial Login request message to RDP')
@@ -5,17 +5,22 @@
 # |           Copyright LSEG 2025. All rights reserved.                       --
 # |-----------------------------------------------------------------------------
 
-import os
 import json
+import logging
 import requests
 import base64
 import time
-from dotenv import load_dotenv
+import rdp_client
+import rdp_config
+import rdp_logging
 
 
-scope = 'trapi'
+scope = rdp_config.get('scope')
 
-RDP_HOST = 'https://api.refinitiv.com'
+log = rdp_logging.get_logger('auth')
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
 
 access_token = None
 refresh_token = None
@@ -44,28 +49,30 @@ def login_v2(client_id, client_secret):
 
     # Send HTTP request
     try:
-        response = requests.post(auth_url, 
+        response = rdp_client.send_request('POST', auth_url, 
                                  data=payload, 
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  verify=True,
                                  allow_redirects=False)
     except requests.exceptions.RequestException as e:
-        print(f'RDP Authentication exception: {e}')
-        return None, None, None
+        log.error('RDP Authentication exception: %s', e)
+        return None, None
     
     if response.status_code == 200:  # HTTP Status 'OK'
-        print('Authentication success')
-        return response.json()['access_token'],  int(response.json()['expires_in'])
+        log.info('Authentication success')
+        content = response.json()
+        return content['access_token'], int(content['expires_in'])
     if response.status_code != 200:
-        print(f'RDP authentication failure: {response.status_code} {response.reason}')
-        print(f'Text: {response.text}')
+        log.error('RDP authentication failure: %s %s', response.status_code, response.reason)
+        rdp_logging.log_payload(log, 'Text', response, logging.ERROR)
         raise requests.exceptions.HTTPError(f'RDP authentication failure: {response.status_code} - {response.text} ', response = response )
     
 
 if __name__ == '__main__':
-    load_dotenv()  # take environment variables from .env.
-    client_id = os.environ['CLIENT_ID']
-    client_secret = os.environ['CLIENT_SECRET']
+    # Show the RDP responses on the console, even when the configuration file disables the transports
+    rdp_logging.setup_logging(console_level=logging.INFO)
+    client_id = rdp_config.get('credentials.client-id')
+    client_secret = rdp_config.get('credentials.client-secret')
 
     try:
         print('Sending initial Login request message to RDP')
@@ -0,0 +1,151 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import httpx
+import requests
+from urllib3.exceptions import NewConnectionError
+from tenacity import (AsyncRetrying, Retrying, retry_if_exception, retry_if_result,
+                      stop_after_attempt, stop_before_delay, wait_random_exponential)
+from rate_limiter import parse_retry_after
+
+# Default retry settings
+MAX_ATTEMPTS = 4
+DEADLINE = 60
+BACKOFF = 0.5
+MAX_BACKOFF = 10
+
+# HTTP status codes of transient failures
+RETRY_STATUS = frozenset([429, 500, 502, 503, 504])
+# HTTP status codes that guarantee the server did not process the request
+NOT_PROCESSED_STATUS = frozenset([429, 503])
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# Transient connection failures (connection reset, timeouts, broken chunked body)
+TRANSIENT_EXCEPTIONS = (requests.exceptions.ConnectionError,
+                        requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError,
+                        httpx.TransportError)
+
+def request_not_sent(exp):
+    """
+    This method checks if the exception happened before the request message was sent.
+
+    Args:
+        exp (Exception): The request exception
+
+    Returns:
+        result (bool): True if the connection could not be established
+    """
+    if isinstance(exp, (requests.exceptions.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if isinstance(exp, requests.exceptions.ConnectionError) and exp.args:
+        return isinstance(getattr(exp.args[0], 'reason', None), NewConnectionError)
+    return False
+
+class RetryPolicy:
+    """
+    This class retries the transient RDP request failures with exponential backoff, full jitter and an overall deadline.
+
+    Non-idempotent requests (POST) are retried only when the server did not process them:
+    the connection could not be established, or the response is HTTP 429/503.
+
+    Args:
+        max_attempts (int): Maximum number of attempts, including the first one
+        deadline (float): Do not start a new attempt after this many seconds
+        backoff (float): The exponential backoff multiplier in seconds
+        max_backoff (float): Maximum wait time between attempts in seconds
+        retry_status (set of int): The HTTP status codes to retry
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, deadline=DEADLINE, backoff=BACKOFF, max_backoff=MAX_BACKOFF, retry_status=RETRY_STATUS):
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_status = frozenset(retry_status)
+        self._wait_jitter = wait_random_exponential(multiplier=backoff, max=max_backoff)
+
+    def _retry(self, method, idempotent):
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        def retry_exception(exp):
+            if not isinstance(exp, TRANSIENT_EXCEPTIONS):
+                return False
+            return idempotent or request_not_sent(exp)
+
+        def retry_result(response):
+            status = getattr(response, 'status_code', None)
+            if status not in self.retry_status:
+                return False
+            return idempotent or status in NOT_PROCESSED_STATUS
+
+        return retry_if_exception(retry_exception) | retry_if_result(retry_result)
+
+    def _wait(self, retry_state):
+        wait = self._wait_jitter(retry_state)
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            retry_after = parse_retry_after(getattr(outcome.result(), 'headers', {}).get('Retry-After'))
+            if retry_after:
+                wait = max(wait, retry_after)
+        return wait
+
+    def _options(self, method, idempotent):
+        return dict(retry=self._retry(method, idempotent),
+                    wait=self._wait,
+                    stop=stop_after_attempt(self.max_attempts) | stop_before_delay(self.deadline),
+                    # Give the last response (or raise the last exception) back to the caller
+                    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+                    reraise=True)
+
+    def call(self, func, method, idempotent=None):
+        """
+        This method calls the function that sends a HTTP request and retries it based on the policy.
+
+        Args:
+            func (function): The function that sends the request and returns the response
+            method (str): The HTTP method
+            idempotent (bool): Override the method idempotency (optional)
+
+        Returns:
+            response: The last HTTP response
+        """
+        return Retrying(**self._options(method, idempotent))(func)
+
+    async def call_async(self, func, method, idempotent=None):
+        """
+        This method awaits the coroutine function that sends a HTTP request and retries it based on the policy.
+
+        Args:
+            func (coroutine function): The coroutine function that sends the request and returns the response
+            method (str): The HTTP method
+            idempotent (bool): Override the method idempotency (optional)
+
+        Returns:
+            response: The last HTTP response
+        """
+        return await AsyncRetrying(**self._options(method, idempotent))(func)
+
+_policy = RetryPolicy()
+
+def get_policy():
+    return _policy
+
+def configure(**kwargs):
+    """
+    This method replaces the shared retry policy.
+
+    Args:
+        **kwargs: The RetryPolicy parameters (max_attempts, deadline, backoff, max_backoff, retry_status)
+
+    Returns:
+        policy (RetryPolicy): The new shared retry policy
+    """
+    global _policy
+    _policy = RetryPolicy(**kwargs)
+    return _policy
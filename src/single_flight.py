@@ -0,0 +1,154 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import asyncio
+import threading
+
+# Identical in-flight GET requests share one response when enabled
+ENABLED = True
+
+def request_key(method, url, params=None, headers=None, **options):
+    """
+    This method returns the key that identifies identical requests.
+    All the headers (the Authorization header too) and the other request options are part of the key, so requests
+    with different tokens, timeouts or TLS settings are never shared.
+
+    Args:
+        method (str): The HTTP method
+        url (str): The RDP endpoint URL
+        params (dict or list of tuple): The query parameters (optional)
+        headers (dict): The request headers (optional)
+        **options: The other request options, e.g. timeout and verify (optional)
+
+    Returns:
+        key (tuple): The hashable request key
+    """
+    if isinstance(params, dict):
+        params = params.items()
+    params = tuple(sorted((str(name), str(value)) for name, value in params or ()))
+    headers = tuple(sorted((str(name).lower(), str(value)) for name, value in (headers or {}).items()))
+    options = tuple(sorted((name, repr(value)) for name, value in options.items()))
+    return method.upper(), url, params, headers, options
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+class SingleFlight:
+    """
+    This class runs one call per key at a time, the threads that ask for a key already in flight wait for
+    that call and get its result (or its exception).
+
+    Args:
+        None
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, func):
+        """
+        This method calls func, or waits for the call of the same key already in flight.
+
+        Args:
+            key (hashable): The request key
+            func (function): The function that sends the request
+
+        Returns:
+            result: The func result, the same object is returned to all the waiters
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as exp:
+            call.exception = exp
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+class AsyncSingleFlight:
+    """
+    This class is the asyncio version of SingleFlight, the coroutines that ask for a key already in flight
+    await the same task. It must be used from one event loop.
+
+    Args:
+        None
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.shared = 0
+
+    async def do(self, key, func):
+        """
+        This method awaits func(), or the task of the same key already in flight.
+
+        Args:
+            key (hashable): The request key
+            func (coroutine function): The function that sends the request
+
+        Returns:
+            result: The func() result, the same object is returned to all the waiters
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.shared += 1
+        # A cancelled waiter does not cancel the shared request
+        return await asyncio.shield(task)
+
+_group = SingleFlight()
+
+def get_group():
+    """
+    This method returns the SingleFlight object shared by the rdp_client requests.
+
+    Args:
+        None
+
+    Returns:
+        group (SingleFlight): The shared SingleFlight object
+    """
+    return _group
+
+def configure(enabled=None):
+    """
+    This method enables or disables the request coalescing of rdp_client.
+
+    Args:
+        enabled (bool): Enable or disable the request coalescing (optional)
+
+    Returns:
+        None
+    """
+    global ENABLED
+    if enabled is not None:
+        ENABLED = enabled
@@ -0,0 +1,215 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import threading
+import time
+import rdp_config
+import rdp_logging
+import requests_session_v1
+import requests_session_v2
+
+log = rdp_logging.get_logger('auth')
+
+# Refresh the token when this ratio of its lifetime has passed
+REFRESH_RATIO = 0.8
+# Wait time before trying again after a failed refresh (seconds)
+RETRY_INTERVAL = 5
+# Maximum wait time for the new token after invalidate(wait=True) (seconds)
+REFRESH_TIMEOUT = 30
+
+class TokenManager:
+    """
+    This class keeps a RDP access token valid on a background thread and hands it out to request threads.
+
+    The subclasses implement login() and refresh(), both return the access token and its expires_in value.
+    """
+
+    def __init__(self, refresh_ratio=REFRESH_RATIO, retry_interval=RETRY_INTERVAL):
+        self.refresh_ratio = refresh_ratio
+        self.retry_interval = retry_interval
+        self._access_token = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._updated = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def login(self):
+        raise NotImplementedError
+
+    def refresh(self):
+        return self.login()
+
+    def start(self):
+        """
+        This method sends the initial login request and starts the background refresh thread.
+
+        Args:
+            None
+
+        Returns:
+            access token (str): The Access Token
+        """
+        with self._lock:
+            if self._thread is not None:
+                return self._access_token
+            self._update(*self.login())
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='rdp-token-manager', daemon=True)
+            self._thread.start()
+        return self._access_token
+
+    def stop(self, revoke=True):
+        """
+        This method stops the background refresh thread.
+
+        Args:
+            revoke (bool): Revoke the access token (Authentication Version 1), False if other processes still use it
+
+        Returns:
+            None
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_token(self):
+        """
+        This method returns the current access token without waiting for any in-progress refresh.
+        The first call starts the token manager, the calls after stop() raise RuntimeError.
+
+        Args:
+            None
+
+        Returns:
+            access token (str): The Access Token
+        """
+        if self._stopped.is_set():
+            raise RuntimeError('The token manager is stopped')
+        if self._access_token is None:
+            return self.start()
+        return self._access_token
+
+    def invalidate(self, access_token=None, wait=False):
+        """
+        This method asks the background thread to refresh now, for example after a HTTP 401 response.
+        Concurrent calls with the same rejected token trigger only one refresh.
+
+        Args:
+            access_token (str): The rejected access token (optional)
+            wait (bool): Wait until the rejected token is replaced, at most REFRESH_TIMEOUT seconds
+
+        Returns:
+            None
+        """
+        rejected = access_token or self._access_token
+        if access_token is None or access_token == self._access_token:
+            self._wakeup.set()
+        if wait:
+            with self._updated:
+                self._updated.wait_for(lambda: self._access_token != rejected or self._stopped.is_set(), REFRESH_TIMEOUT)
+
+    @property
+    def expires_in(self):
+        return max(0, self._expires_at - time.monotonic())
+
+    def _update(self, access_token, expires_in):
+        if not access_token:
+            raise RuntimeError('RDP authentication did not return an access token')
+        with self._updated:
+            self._expires_at = time.monotonic() + int(expires_in)
+            self._access_token = access_token
+            self._updated.notify_all()
+
+    def _next_refresh_delay(self, lifetime):
+        return max(0, lifetime * self.refresh_ratio - (lifetime - self.expires_in))
+
+    def _run(self):
+        lifetime = self.expires_in
+        delay = self._next_refresh_delay(lifetime)
+        while not self._stopped.is_set():
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                access_token, expires_in = self.refresh()
+                self._update(access_token, expires_in)
+                lifetime = int(expires_in)
+                delay = self._next_refresh_delay(lifetime)
+            except Exception:
+                log.exception('RDP token refresh exception')
+                delay = min(self.retry_interval, max(self.expires_in, 0.1))
+
+class TokenManagerV1(TokenManager):
+    """
+    This class manages a RDP Authentication Service V1 session, it refreshes with the refresh_token grant.
+    """
+
+    def __init__(self, username, password, app_key, **kwargs):
+        super().__init__(**kwargs)
+        self.username = username
+        self.password = password
+        self.app_key = app_key
+        self._refresh_token = None
+
+    def login(self):
+        access_token, refresh_token, expires_in = requests_session_v1.login_v1(self.username, self.password, self.app_key)
+        self._refresh_token = refresh_token
+        return access_token, expires_in
+
+    def refresh(self):
+        # The refresh token expires as well, fallback to the password grant if it is rejected
+        try:
+            access_token, refresh_token, expires_in = requests_session_v1.refresh_login_v1(self._refresh_token, self.app_key)
+        except Exception:
+            access_token = None
+        if not access_token:
+            return self.login()
+        self._refresh_token = refresh_token
+        return access_token, expires_in
+
+    def stop(self, revoke=True):
+        super().stop()
+        if self._access_token and revoke:
+            requests_session_v1.logout(self.app_key, self._access_token)
+        self._access_token = None
+
+class TokenManagerV2(TokenManager):
+    """
+    This class manages a RDP Authentication Service V2 session, it re-login with the client_credentials grant.
+    """
+
+    def __init__(self, client_id, client_secret, **kwargs):
+        super().__init__(**kwargs)
+        self.client_id = client_id
+        self.client_secret = client_secret
+
+    def login(self):
+        return requests_session_v2.login_v2(self.client_id, self.client_secret)
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    try:
+        print('Start Token Manager (Authentication Version 1)')
+        token_manager = TokenManagerV1(username, password, app_key)
+        token_manager.start()
+        print(f'Access Token: {token_manager.get_token()}')
+        print(f'Expires in: {token_manager.expires_in:.0f}')
+        # code to request data with token_manager.get_token()
+
+        time.sleep(20)
+        print('Stop Token Manager')
+        token_manager.stop()
+    except Exception as exp:
+        print(f'Exception {exp}')
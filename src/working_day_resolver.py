@@ -0,0 +1,216 @@
+# |-----------------------------------------------------------------------------
+# |            This source code is provided under the Apache 2.0 license      --
+# |  and is provided AS IS with no warranty or guarantee of fit for purpose.  --
+# |                See the project's LICENSE.md for details.                  --
+# |           Copyright LSEG 2025. All rights reserved.                       --
+# |-----------------------------------------------------------------------------
+
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import rdp_client
+import rdp_config
+import requests_session_v1
+
+# Set the RDP_HOST environment variable (or the 'rdp' section host) to use another host (e.g. the local mock_rdp_server.py)
+RDP_HOST = rdp_config.get('host')
+
+# Maximum number of calendar/date items per is-working-day request
+BATCH_SIZE = 100
+# The answers for today and the future dates are requested again after this time (seconds), a holiday may be announced
+FUTURE_TTL = 24 * 60 * 60
+
+def calendar_key(codes):
+    """
+    This method returns the cache key of a set of calendar codes, the order of the codes does not matter.
+
+    Args:
+        codes (str or list of str): The calendar (country) code(s)
+
+    Returns:
+        key (tuple of str): The sorted calendar codes
+    """
+    if isinstance(codes, str):
+        codes = [codes]
+    return tuple(sorted(set(codes)))
+
+def requests_poster(access_token, host=None):
+    """
+    This method returns a function that posts the is-working-day request messages with Python requests.
+
+    Args:
+        access_token (str or TokenManager): The access token, or an object with a get_token() method
+        host (str): The RDP host URL (optional)
+
+    Returns:
+        post (function): The function that sends a request message and returns the response content
+    """
+    def send(payload, token):
+        # The request has no side effect, so it is safe to retry
+        return rdp_client.send_request('POST', f'{host or RDP_HOST}/analytics/functions/v1/common/is-working-day',
+                                       headers={'Authorization': f'Bearer {token}'},
+                                       json=payload,
+                                       idempotent=True)
+
+    def post(payload):
+        token = access_token.get_token() if hasattr(access_token, 'get_token') else access_token
+        response = send(payload, token)
+        if response.status_code == 401 and hasattr(access_token, 'invalidate'):
+            # The token was rejected before its scheduled refresh, retry once with the new one
+            access_token.invalidate(token, wait=True)
+            response = send(payload, access_token.get_token())
+        response.raise_for_status()
+        return response.json()
+    return post
+
+class WorkingDayResolver:
+    """
+    This class answers the RDP Analytics is-working-day question for many calendar/date pairs. The unknown pairs are sent
+    in multi-item requests concurrently, and the answers are kept in memory (and in SQLite if a path is set). The answers
+    for past dates are kept forever since past holidays never change, the answers for today and the future dates
+    expire after FUTURE_TTL seconds.
+
+    Args:
+        post (function): The function that sends a request message and returns the response content, see requests_poster()
+        batch_size (int): Maximum number of items per request
+        max_workers (int): Maximum number of concurrent requests
+        path (str): The SQLite database file path of the persistent cache (optional)
+    """
+
+    def __init__(self, post, batch_size=BATCH_SIZE, max_workers=rdp_client.POOL_MAXSIZE, path=None):
+        self.post = post
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._answers = {}
+        self._expires = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS working_days (calendars TEXT, day TEXT, working INTEGER, expires_at REAL, PRIMARY KEY (calendars, day))')
+            if 'expires_at' not in [column[1] for column in self._db.execute('PRAGMA table_info(working_days)')]:
+                # A database written before the future answers expired
+                self._db.execute('ALTER TABLE working_days ADD COLUMN expires_at REAL')
+            self._db.commit()
+            for calendars, day, working, expires_at in self._db.execute('SELECT calendars, day, working, expires_at FROM working_days'):
+                key = (tuple(json.loads(calendars)), day)
+                self._answers[key] = bool(working)
+                if expires_at is not None:
+                    self._expires[key] = expires_at
+
+    def close(self):
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+                self._db = None
+
+    def is_working_day(self, codes, date):
+        """
+        This method returns if the date is a working day in all the calendars.
+
+        Args:
+            codes (str or list of str): The calendar (country) code(s)
+            date (str or datetime.date): The date, in YYYY-MM-DD format if a string
+
+        Returns:
+            result (bool): True if it is a working day
+        """
+        key = (calendar_key(codes), str(date)[:10])
+        answer = self._answers.get(key) if not self._is_expired(key) else None
+        if answer is None:
+            answer = self.resolve([key])[key]
+        return answer
+
+    def resolve(self, pairs):
+        """
+        This method returns the answers of many calendar/date pairs, only the pairs not cached yet are requested.
+
+        Args:
+            pairs (list of tuple): The (calendar code(s), date) pairs
+
+        Returns:
+            answers (dict): True for a working day, keyed by (sorted calendar codes tuple, 'YYYY-MM-DD')
+        """
+        keys = list(dict.fromkeys((calendar_key(codes), str(date)[:10]) for codes, date in pairs))
+        missing = [key for key in keys if key not in self._answers or self._is_expired(key)]
+        if missing:
+            batches = [missing[index:index + self.batch_size] for index in range(0, len(missing), self.batch_size)]
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                for batch, answers in zip(batches, executor.map(self._request, batches)):
+                    self._store(dict(zip(batch, answers)))
+        return {key: self._answers[key] for key in keys}
+
+    def precompute_year(self, codes, year):
+        """
+        This method resolves every day of a year for the calendars.
+
+        Args:
+            codes (str or list of str): The calendar (country) code(s)
+            year (int): The year
+
+        Returns:
+            working days (list of datetime.date): The working days of the year
+        """
+        first = datetime.date(year, 1, 1)
+        days = [first + datetime.timedelta(days=offset) for offset in range((datetime.date(year + 1, 1, 1) - first).days)]
+        answers = self.resolve([(codes, day) for day in days])
+        key = calendar_key(codes)
+        return [day for day in days if answers[(key, day.isoformat())]]
+
+    def _request(self, batch):
+        payload = {'universe': [{'calendarCodes': list(calendars), 'calculationDate': day} for calendars, day in batch]}
+        data = self.post(payload).get('data', [])
+        if len(data) != len(batch):
+            raise ValueError(f'is-working-day returned {len(data)} items for {len(batch)} requested')
+        # The items are in the order of the request universe
+        answers = []
+        for (calendars, day), item in zip(batch, data):
+            if 'isWorkingDay' not in item:
+                raise ValueError(f'is-working-day error for {list(calendars)} {day}: {item.get("error", item)}')
+            answers.append(bool(item['isWorkingDay']))
+        return answers
+
+    def _is_expired(self, key):
+        expires_at = self._expires.get(key)
+        return expires_at is not None and expires_at <= time.time()
+
+    def _store(self, answers):
+        today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        expires_at = time.time() + FUTURE_TTL
+        expiries = {key: None if key[1] < today else expires_at for key in answers}
+        with self._lock:
+            self._answers.update(answers)
+            for key, expiry in expiries.items():
+                if expiry is None:
+                    self._expires.pop(key, None)
+                else:
+                    self._expires[key] = expiry
+            if self._db is not None:
+                with self._db:
+                    self._db.executemany('INSERT OR REPLACE INTO working_days (calendars, day, working, expires_at) VALUES (?, ?, ?, ?)',
+                                         [(json.dumps(list(calendars)), day, int(working), expiries[(calendars, day)])
+                                          for (calendars, day), working in answers.items()])
+
+if __name__ == '__main__':
+    username = rdp_config.get('credentials.username')
+    password = rdp_config.get('credentials.password')
+    app_key = rdp_config.get('credentials.app-key')
+
+    try:
+        print('Sending initial Login request message to RDP')
+        access_token, refresh_token, expires_in = requests_session_v1.login_v1(username, password, app_key)
+
+        if access_token:
+            resolver = WorkingDayResolver(requests_poster(access_token))
+            for codes in (['THA'], ['USA'], ['THA', 'USA']):
+                working_days = resolver.precompute_year(codes, 2025)
+                print(f'{codes}: {len(working_days)} working days in 2025')
+            print(f'THA 2025-02-12 is a working day: {resolver.is_working_day("THA", "2025-02-12")}')
+
+            print('Sending Logout request message to RDP')
+            requests_session_v1.logout(app_key, access_token)
+    except Exception as exp:
+        print(f'Exception {exp}')